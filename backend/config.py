@@ -3,7 +3,7 @@
 # Environment-based configuration with Pydantic Settings
 # =============================================================================
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic_settings import BaseSettings
@@ -35,8 +35,17 @@ class Settings(BaseSettings):
     postgres_db: str = "brkops2585"
     postgres_user: str = "brkops"
     postgres_password: str = "changeme"
-
-    @property
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_timeout: int = 30
+    # asyncpg prepared statement caches (per connection). Both must be set to 0
+    # when connecting through pgbouncer in transaction pooling mode.
+    db_statement_cache_size: int = 100
+    # SQLAlchemy compiled-statement cache (per engine)
+    db_query_cache_size: int = 1200
+
+    @cached_property
     def database_url(self) -> str:
         """Construct async database URL."""
         return (
@@ -44,7 +53,7 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
         """Construct sync database URL for migrations."""
         return (
@@ -59,7 +68,7 @@ class Settings(BaseSettings):
     redis_port: int = 6379
     redis_password: Optional[str] = None
 
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Construct Redis URL."""
         if self.redis_password:
@@ -88,6 +97,9 @@ class Settings(BaseSettings):
     splunk_mcp_url: Optional[str] = None
     splunk_host: Optional[str] = None
     splunk_token: Optional[str] = None
+    # Upper bounds (seconds) for router calls to an MCP server
+    mcp_test_timeout: int = 10
+    mcp_tool_timeout: int = 30
 
     # ==========================================================================
     # Notifications
@@ -120,3 +132,6 @@ def get_settings() -> Settings:
 
 # Export singleton
 settings = get_settings()
+
+# Connection URL resolved once at import
+DATABASE_URL = settings.database_url
@@ -3,20 +3,47 @@
 # Async SQLAlchemy with PostgreSQL
 # =============================================================================
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from config import settings
+from config import DATABASE_URL, settings
+
+
+def _json_serializer(obj: Any) -> str:
+    """Encode JSON/JSONB bind values with orjson (asyncpg expects text)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 # Create async engine
 engine = create_async_engine(
-    settings.database_url,
+    DATABASE_URL,
     echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    # No per-checkout liveness ping: pool_recycle retires connections before the
+    # server closes them and TCP keepalives detect dead sockets.
+    pool_pre_ping=False,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_timeout=settings.db_pool_timeout,
+    query_cache_size=settings.db_query_cache_size,
+    # Server-side TCP keepalives so idle sockets behind NAT are not silently dropped.
+    # Statements are prepared once per connection and reused (asyncpg + SQLAlchemy
+    # caches); the deployment connects to Postgres directly, not via pgbouncer
+    # transaction pooling, so the caches stay enabled.
+    connect_args={
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        "statement_cache_size": settings.db_statement_cache_size,
+        "server_settings": {
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "5",
+        }
+    },
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Session factory
@@ -47,11 +74,18 @@ async def close_db() -> None:
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database sessions."""
+    """
+    Dependency for getting database sessions.
+
+    Commits only when the request left pending ORM changes, so read-only
+    requests skip the COMMIT round-trip. Core-level writes (update()/delete()
+    statements) are not tracked by the session and must commit explicitly.
+    """
     async with async_session() as session:
         try:
             yield session
-            await session.commit()
+            if session.new or session.dirty or session.deleted:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
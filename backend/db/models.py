@@ -5,18 +5,20 @@
 import enum
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
     Enum,
+    FetchedValue,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, INET, JSONB, UUID, ENUM
 from sqlalchemy.orm import relationship
@@ -111,6 +113,37 @@ class UserRole(str, enum.Enum):
     VIEWER = "viewer"
 
 
+def _enum_values(enum_cls):
+    """Store enum values (not member names) in the PostgreSQL ENUM."""
+    return [member.value for member in enum_cls]
+
+
+notification_channel_enum = ENUM(
+    NotificationChannel, name='notification_channel', create_type=False,
+    values_callable=_enum_values,
+)
+
+notification_status_enum = ENUM(
+    NotificationStatus, name='notification_status', create_type=False,
+    values_callable=_enum_values,
+)
+
+mcp_server_type_enum = ENUM(
+    MCPServerType, name='mcp_server_type', create_type=False,
+    values_callable=_enum_values,
+)
+
+health_status_enum = ENUM(
+    HealthStatus, name='health_status', create_type=False,
+    values_callable=_enum_values,
+)
+
+user_role_enum = ENUM(
+    UserRole, name='user_role', create_type=False,
+    values_callable=_enum_values,
+)
+
+
 # =============================================================================
 # Models
 # =============================================================================
@@ -124,55 +157,78 @@ class ConfigVariable(Base):
     value = Column(JSONB, nullable=False)
     description = Column(Text)
     category = Column(String(100), nullable=False, index=True)
-    is_secret = Column(Boolean, default=False)
+    is_secret = Column(Boolean, server_default=text("false"))
     validation_schema = Column(JSONB)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
 
 class MCPServer(Base):
     """MCP Server registry."""
 
     __tablename__ = "mcp_servers"
+    __table_args__ = (
+        Index("idx_mcp_servers_name_type", "name", "type", unique=True),
+        Index("idx_mcp_servers_type_active", "type", postgresql_where=text("is_active")),
+    )
 
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
-    type = Column(String(50), nullable=False)  # 'cml', 'splunk', 'custom'
+    type = Column(mcp_server_type_enum, nullable=False)
     endpoint = Column(String(500), nullable=False)
-    auth_config = Column(JSONB, default={})
-    is_active = Column(Boolean, default=True)
-    health_status = Column(String(50), default='unknown')  # 'healthy', 'unhealthy', 'unknown'
+    auth_config = Column(JSONB, server_default=text("'{}'::jsonb"))
+    is_active = Column(Boolean, server_default=text("true"))
+    health_status = Column(health_status_enum, default='unknown')
     last_health_check = Column(DateTime(timezone=True))
-    available_tools = Column(JSONB, default=[])
+    available_tools = Column(JSONB, server_default=text("'[]'::jsonb"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
 
 class PipelineJob(Base):
     """Pipeline job tracking."""
 
     __tablename__ = "pipeline_jobs"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    __table_args__ = (
+        Index("idx_pipeline_jobs_status_created", "status", "created_at"),
+        Index(
+            "idx_pipeline_jobs_active",
+            "current_stage",
+            postgresql_where=text("status IN ('running', 'paused', 'queued')"),
+        ),
+        Index(
+            "idx_pipeline_jobs_finished_completed",
+            "completed_at",
+            postgresql_where=text("status IN ('completed', 'cancelled')"),
+        ),
+        Index(
+            "idx_pipeline_jobs_stages_gin",
+            "stages_data",
+            postgresql_using="gin",
+            postgresql_ops={"stages_data": "jsonb_path_ops"},
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     use_case_id = Column(Integer, ForeignKey("use_cases.id", ondelete="SET NULL"))
     use_case_name = Column(String(100), nullable=False)
     input_text = Column(Text, nullable=False)
     input_audio_url = Column(Text)
-    input_metadata = Column(JSONB, default={})  # Stores LLM matching results
+    input_metadata = Column(JSONB, server_default=text("'{}'::jsonb"))  # Stores LLM matching results
     selected_lab_id = Column(String, nullable=True)
     current_stage = Column(pipeline_stage_enum, nullable=False, default='voice_input')
     status = Column(job_status_enum, nullable=False, default='pending')
-    stages_data = Column(JSONB, default={})
+    stages_data = Column(JSONB, server_default=text("'{}'::jsonb"))
     result = Column(JSONB)
     error_message = Column(Text)
     error_details = Column(JSONB)
-    retry_count = Column(Integer, default=0)
-    max_retries = Column(Integer, default=3)
+    retry_count = Column(Integer, server_default=text("0"))
+    max_retries = Column(Integer, server_default=text("3"))
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     created_by = Column(String(100), default="system")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
     use_case = relationship("UseCase", back_populates="jobs")
@@ -188,17 +244,17 @@ class UseCase(Base):
     name = Column(String(100), unique=True, nullable=False)
     display_name = Column(String(200), nullable=False)
     description = Column(Text)
-    trigger_keywords = Column(ARRAY(Text), default=[])
+    trigger_keywords = Column(ARRAY(Text), server_default=text("'{}'::text[]"))
     intent_prompt = Column(Text, nullable=False)
     config_prompt = Column(Text, nullable=False)
     analysis_prompt = Column(Text, nullable=False)
-    notification_template = Column(JSONB, default={})
+    notification_template = Column(JSONB, server_default=text("'{}'::jsonb"))
     cml_target_lab = Column(String(100))
     splunk_index = Column(String(100), default="netops")
     convergence_wait_seconds = Column(Integer, default=45)
-    servicenow_enabled = Column(Boolean, default=False)
-    allowed_actions = Column(ARRAY(Text), default=[])
-    scope_validation_enabled = Column(Boolean, default=True)
+    servicenow_enabled = Column(Boolean, server_default=text("false"))
+    allowed_actions = Column(ARRAY(Text), server_default=text("'{}'::text[]"))
+    scope_validation_enabled = Column(Boolean, server_default=text("true"))
     llm_provider = Column(String(50), nullable=True)  # 'openai', 'anthropic', or NULL for global default
     llm_model = Column(String(100), nullable=True)  # specific model name, or NULL for global default
     # Dynamic pipeline configuration (replaces hardcoded branching)
@@ -209,10 +265,10 @@ class UseCase(Base):
     post_checks = Column(JSONB, default=["Verify device reachability", "Confirm expected state"])
     risk_profile = Column(JSONB, default={"risk_factors": ["Configuration change"], "mitigation_steps": ["Review carefully before approval"], "affected_services": ["Network services"]})
     ospf_config_strategy = Column(String(20), default='dual')
-    is_active = Column(Boolean, default=True)
-    sort_order = Column(Integer, default=0)
+    is_active = Column(Boolean, server_default=text("true"))
+    sort_order = Column(Integer, server_default=text("0"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
 
     # Relationships
     jobs = relationship("PipelineJob", back_populates="use_case")
@@ -222,17 +278,22 @@ class Notification(Base):
     """Notification history."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("idx_notifications_job", "job_id"),
+        Index("idx_notifications_channel_created", "channel", "created_at"),
+        Index("idx_notifications_status_created", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     job_id = Column(UUID(as_uuid=True), ForeignKey("pipeline_jobs.id", ondelete="SET NULL"))
-    channel = Column(ENUM('webex', 'servicenow', 'email', 'slack', name='notification_channel', create_type=False), nullable=False)
+    channel = Column(notification_channel_enum, nullable=False)
     recipient = Column(Text, nullable=False)
     subject = Column(Text)
     message = Column(Text, nullable=False)
-    status = Column(ENUM('pending', 'sent', 'delivered', 'failed', name='notification_status', create_type=False), nullable=False, default='pending')
+    status = Column(notification_status_enum, nullable=False, default='pending')
     response_data = Column(JSONB)
     error_message = Column(Text)
-    retry_count = Column(Integer, default=0)
+    retry_count = Column(Integer, server_default=text("0"))
     sent_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -244,6 +305,9 @@ class AuditLog(Base):
     """Audit log for tracking actions."""
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("idx_audit_logs_entity", "entity_type", "entity_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     entity_type = Column(String(50), nullable=False)
@@ -252,7 +316,7 @@ class AuditLog(Base):
     actor = Column(String(100), nullable=False, default="system")
     old_values = Column(JSONB)
     new_values = Column(JSONB)
-    extra_data = Column(JSONB, default={})
+    extra_data = Column(JSONB, server_default=text("'{}'::jsonb"))
     ip_address = Column(INET)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -267,8 +331,8 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
     full_name = Column(String(200))
-    role = Column(String(50), default='viewer')
-    is_active = Column(Boolean, default=True)
+    role = Column(user_role_enum, default='viewer')
+    is_active = Column(Boolean, server_default=text("true"))
     last_login = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())
@@ -4,18 +4,40 @@
 # =============================================================================
 
 import asyncio
+import importlib
+import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+from uuid import UUID
 
+import orjson
 import structlog
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from config import settings
 from db.database import init_db, close_db
-from routers import operations, voice, mcp, notifications, admin, jobs
+from services.job_queue import close_arq_pool, init_arq_pool
+from services.splunk_client import close_http_client
 from services.websocket_manager import manager
+from utils.orjson_response import ORJSONResponse
+
+_ERROR_METHODS = frozenset({"error", "exception", "critical"})
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_error_context(logger, method_name, event_dict):
+    """Render stack and exception info only for error-level events."""
+    if method_name in _ERROR_METHODS:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """orjson serializer for structlog (stdlib logging expects str, not bytes)."""
+    return orjson.dumps(obj, **kwargs).decode()
+
 
 # Configure structured logging
 structlog.configure(
@@ -25,12 +47,15 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_error_context,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     ],
-    wrapper_class=structlog.stdlib.BoundLogger,
+    # Calls below LOG_LEVEL are no-op methods on the filtering wrapper, so they
+    # never build an event dict or enter the processor chain
+    wrapper_class=structlog.make_filtering_bound_logger(
+        logging.getLevelNamesMapping().get(settings.log_level.upper(), logging.INFO)
+    ),
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
@@ -52,47 +77,81 @@ async def sync_mcp_credentials_from_env():
     from db.database import async_session
     from db.models import MCPServer
 
+    sync_splunk = bool(settings.splunk_token and settings.splunk_host)
+    sync_cml = bool(settings.cml_host and settings.cml_username)
+    if not (sync_splunk or sync_cml):
+        return
+
     async with async_session() as db:
+        # Fetch both servers in a single round-trip
+        result = await db.execute(
+            select(MCPServer.id, MCPServer.type, MCPServer.auth_config)
+            .where(MCPServer.type.in_(['splunk', 'cml']))
+        )
+        servers = {row.type: row for row in result}
+        synced = []
+
         # Sync Splunk token from env
-        if settings.splunk_token and settings.splunk_host:
-            result = await db.execute(
-                select(MCPServer).where(MCPServer.type == 'splunk')
+        splunk_server = servers.get('splunk') if sync_splunk else None
+        if splunk_server and not (splunk_server.auth_config or {}).get("token", ""):
+            # DB has empty token but env has one - sync it
+            values = {
+                "auth_config": {
+                    "host": settings.splunk_host,
+                    "token": settings.splunk_token,
+                },
+                "is_active": True,
+            }
+            if settings.splunk_mcp_url:
+                values["endpoint"] = settings.splunk_mcp_url
+            await db.execute(
+                update(MCPServer).where(MCPServer.id == splunk_server.id).values(**values)
             )
-            splunk_server = result.scalar_one_or_none()
-            if splunk_server:
-                current_token = (splunk_server.auth_config or {}).get("token", "")
-                if not current_token:
-                    # DB has empty token but env has one - sync it
-                    new_auth = {
-                        "host": settings.splunk_host,
-                        "token": settings.splunk_token,
-                    }
-                    splunk_server.auth_config = new_auth
-                    if settings.splunk_mcp_url:
-                        splunk_server.endpoint = settings.splunk_mcp_url
-                    splunk_server.is_active = True
-                    await db.commit()
-                    logger.info("Synced Splunk credentials from environment to database")
+            synced.append("Splunk")
 
         # Sync CML credentials from env
-        if settings.cml_host and settings.cml_username:
-            result = await db.execute(
-                select(MCPServer).where(MCPServer.type == 'cml')
+        cml_server = servers.get('cml') if sync_cml else None
+        if cml_server and not (cml_server.auth_config or {}).get("password", ""):
+            values = {
+                "auth_config": {
+                    "host": settings.cml_host,
+                    "username": settings.cml_username,
+                    "password": settings.cml_password,
+                },
+            }
+            if settings.cml_mcp_url:
+                values["endpoint"] = settings.cml_mcp_url
+            await db.execute(
+                update(MCPServer).where(MCPServer.id == cml_server.id).values(**values)
             )
-            cml_server = result.scalar_one_or_none()
-            if cml_server:
-                current_password = (cml_server.auth_config or {}).get("password", "")
-                if not current_password:
-                    new_auth = {
-                        "host": settings.cml_host,
-                        "username": settings.cml_username,
-                        "password": settings.cml_password,
-                    }
-                    cml_server.auth_config = new_auth
-                    if settings.cml_mcp_url:
-                        cml_server.endpoint = settings.cml_mcp_url
-                    await db.commit()
-                    logger.info("Synced CML credentials from environment to database")
+            synced.append("CML")
+
+        if synced:
+            await db.commit()
+            for name in synced:
+                logger.info(f"Synced {name} credentials from environment to database")
+
+
+# =============================================================================
+# Routers
+# =============================================================================
+# (module, prefix, tag) - imported on startup rather than at module import so
+# router modules and their client dependencies load after logging is configured
+ROUTERS = (
+    ("routers.operations", "/api/v1/operations", "Operations"),
+    ("routers.voice", "/api/v1/voice", "Voice"),
+    ("routers.mcp", "/api/v1/mcp", "MCP"),
+    ("routers.notifications", "/api/v1/notifications", "Notifications"),
+    ("routers.admin", "/api/v1/admin", "Admin"),
+    ("routers.jobs", "/api/v1/jobs", "Jobs"),
+)
+
+
+def _mount_routers(app: FastAPI) -> None:
+    """Import the API router modules and include them in the application."""
+    for module_name, prefix, tag in ROUTERS:
+        module = importlib.import_module(module_name)
+        app.include_router(module.router, prefix=prefix, tags=[tag])
 
 
 @asynccontextmanager
@@ -101,6 +160,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     logger.info("Starting BRKOPS-2585 Backend", version=settings.app_version)
 
+    # Mount API routers
+    _mount_routers(app)
+
     # Initialize database
     await init_db()
     logger.info("Database initialized")
@@ -108,10 +170,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Sync MCP credentials from environment into DB
     await sync_mcp_credentials_from_env()
 
+    # Shared arq/Redis pool for job endpoints
+    await init_arq_pool(app)
+
     yield
 
     # Shutdown
     logger.info("Shutting down BRKOPS-2585 Backend")
+    await close_arq_pool(app)
+    await close_http_client()
     await close_db()
     logger.info("Database connections closed")
 
@@ -124,6 +191,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # =============================================================================
@@ -135,27 +203,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Notification history pages are linked through this response header
+    expose_headers=["X-Next-Cursor"],
 )
 
 
-# =============================================================================
-# Include Routers
-# =============================================================================
-app.include_router(operations.router, prefix="/api/v1/operations", tags=["Operations"])
-app.include_router(voice.router, prefix="/api/v1/voice", tags=["Voice"])
-app.include_router(mcp.router, prefix="/api/v1/mcp", tags=["MCP"])
-app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["Notifications"])
-app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
-app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["Jobs"])
-
-
 # =============================================================================
 # Health Check
 # =============================================================================
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for container orchestration."""
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "status": "healthy",
             "service": "brkops-2585-backend",
@@ -179,6 +238,20 @@ async def root():
 # =============================================================================
 # WebSocket Endpoint for Real-time Events
 # =============================================================================
+_SUB_ACK_TMPL = '{{"type":"subscribed","job_id":"{}"}}'
+
+
+def _is_job_id(value) -> bool:
+    """Check that a subscribe target is a UUID string."""
+    if not isinstance(value, str):
+        return False
+    try:
+        UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
 @app.websocket("/ws/events")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -212,25 +285,25 @@ async def websocket_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
 
             # Handle client messages (e.g., subscribe to specific job)
-            # Support both JSON format and legacy colon-separated format
+            # Support both JSON format and legacy colon-separated format,
+            # dispatching on the first character instead of probing with json
             job_id = None
 
-            # Try JSON format first
-            try:
-                import json
-                message = json.loads(data)
-                if message.get("type") == "subscribe" and message.get("job_id"):
-                    job_id = message["job_id"]
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-            # Fallback to legacy colon-separated format
-            if not job_id and data.startswith("subscribe:"):
-                job_id = data.split(":")[1]
-
-            if job_id:
+            if data[:1] == "{":
+                try:
+                    message = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    message = None
+                if isinstance(message, dict) and message.get("type") == "subscribe":
+                    job_id = message.get("job_id")
+            elif data.startswith("subscribe:"):
+                job_id = data[10:]
+
+            if job_id and _is_job_id(job_id):
                 await manager.subscribe_to_job(websocket, job_id)
-                await websocket.send_json({"type": "subscribed", "job_id": job_id})
+                # job_id is a validated UUID, so it can be spliced into the
+                # pre-rendered ack without JSON escaping
+                await websocket.send_text(_SUB_ACK_TMPL.format(job_id))
                 logger.debug("WebSocket subscribed to job", job_id=job_id)
 
     except WebSocketDisconnect:
@@ -241,11 +314,22 @@ async def websocket_endpoint(websocket: WebSocket):
 # =============================================================================
 # Error Handlers
 # =============================================================================
+# Strong references to in-flight log tasks so they are not garbage collected
+_log_tasks: set = set()
+
+
+async def _log_unhandled_exception(path: str, exc: Exception) -> None:
+    """Render and emit the unhandled-exception log entry off the event loop."""
+    await asyncio.to_thread(logger.error, "Unhandled exception", error=str(exc), path=path)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
-    logger.error("Unhandled exception", error=str(exc), path=request.url.path)
-    return JSONResponse(
+    task = asyncio.create_task(_log_unhandled_exception(request.url.path, exc))
+    _log_tasks.add(task)
+    task.add_done_callback(_log_tasks.discard)
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -257,9 +341,21 @@ async def global_exception_handler(request, exc):
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(
-        "main:app",
-        host=settings.backend_host,
-        port=settings.backend_port,
-        reload=settings.debug,
-    )
+    if settings.debug:
+        # The reloader needs an import string to re-import the app on change
+        uvicorn.run(
+            "main:app",
+            host=settings.backend_host,
+            port=settings.backend_port,
+            reload=True,
+        )
+    else:
+        # Serve the already-imported app instead of importing main a second time
+        uvicorn.run(
+            app,
+            host=settings.backend_host,
+            port=settings.backend_port,
+            loop="uvloop",
+            http="httptools",
+            access_log=False,
+        )
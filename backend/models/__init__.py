@@ -2,46 +2,88 @@
 # BRKOPS-2585 Pydantic Models
 # Request/Response schemas
 # =============================================================================
+# Re-exports are resolved lazily (PEP 562) so importing one schema module,
+# e.g. ``from models.admin import ...``, does not build every other module's
+# pydantic core schemas at startup.
 
-from models.operations import (
-    OperationCreate,
-    OperationResponse,
-    OperationStatus,
-    StageData,
-    ApprovalRequest,
-)
-from models.voice import (
-    TranscriptionRequest,
-    TranscriptionResponse,
-)
-from models.mcp import (
-    MCPServerCreate,
-    MCPServerUpdate,
-    MCPServerResponse,
-    MCPToolExecute,
-    MCPToolResponse,
-)
-from models.notifications import (
-    NotificationCreate,
-    NotificationResponse,
-    WebExMessage,
-    ServiceNowTicket,
-)
-from models.admin import (
-    ConfigVariableCreate,
-    ConfigVariableUpdate,
-    ConfigVariableResponse,
-    UseCaseCreate,
-    UseCaseUpdate,
-    UseCaseResponse,
-)
-from models.common import (
-    PaginatedResponse,
-    ErrorResponse,
-    HealthResponse,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from models.operations import (
+        OperationCreate,
+        OperationResponse,
+        OperationStatus,
+        StageData,
+        ApprovalRequest,
+    )
+    from models.voice import (
+        TranscriptionRequest,
+        TranscriptionResponse,
+    )
+    from models.mcp import (
+        MCPServerCreate,
+        MCPServerUpdate,
+        MCPServerResponse,
+        MCPToolExecute,
+        MCPToolResponse,
+    )
+    from models.notifications import (
+        NotificationCreate,
+        NotificationResponse,
+        WebExMessage,
+        ServiceNowTicket,
+    )
+    from models.admin import (
+        ConfigVariableCreate,
+        ConfigVariableUpdate,
+        ConfigVariableResponse,
+        UseCaseCreate,
+        UseCaseUpdate,
+        UseCaseResponse,
+    )
+    from models.common import (
+        PaginatedResponse,
+        ErrorResponse,
+        HealthResponse,
+    )
 
-__all__ = [
+_LAZY = {
+    # Operations
+    "OperationCreate": "models.operations",
+    "OperationResponse": "models.operations",
+    "OperationStatus": "models.operations",
+    "StageData": "models.operations",
+    "ApprovalRequest": "models.operations",
+    # Voice
+    "TranscriptionRequest": "models.voice",
+    "TranscriptionResponse": "models.voice",
+    # MCP
+    "MCPServerCreate": "models.mcp",
+    "MCPServerUpdate": "models.mcp",
+    "MCPServerResponse": "models.mcp",
+    "MCPToolExecute": "models.mcp",
+    "MCPToolResponse": "models.mcp",
+    # Notifications
+    "NotificationCreate": "models.notifications",
+    "NotificationResponse": "models.notifications",
+    "WebExMessage": "models.notifications",
+    "ServiceNowTicket": "models.notifications",
+    # Admin
+    "ConfigVariableCreate": "models.admin",
+    "ConfigVariableUpdate": "models.admin",
+    "ConfigVariableResponse": "models.admin",
+    "UseCaseCreate": "models.admin",
+    "UseCaseUpdate": "models.admin",
+    "UseCaseResponse": "models.admin",
+    # Common
+    "PaginatedResponse": "models.common",
+    "ErrorResponse": "models.common",
+    "HealthResponse": "models.common",
+}
+
+# Literal so linters and IDEs see the TYPE_CHECKING imports as re-exports
+__all__ = (
     # Operations
     "OperationCreate",
     "OperationResponse",
@@ -73,4 +115,19 @@ __all__ = [
     "PaginatedResponse",
     "ErrorResponse",
     "HealthResponse",
-]
+)
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access and cache the attribute."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(__all__))
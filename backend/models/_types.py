@@ -0,0 +1,24 @@
+# =============================================================================
+# BRKOPS-2585 Shared Field Types
+# Reusable annotated types for schema fields
+# =============================================================================
+
+from typing import Annotated, Any, Dict, List
+
+from pydantic import StringConstraints, WithJsonSchema
+
+# Free-form JSON object (JSONB-backed columns, tool parameters, auth config)
+JsonDict = Annotated[Dict[str, Any], WithJsonSchema({"type": "object"})]
+
+# List of plain strings (keywords, actions, check lists)
+StrList = Annotated[List[str], WithJsonSchema({"type": "array", "items": {"type": "string"}})]
+
+# Canonical 8-4-4-4-12 hex UUID text
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+# Canonical UUID text, format-checked without building a uuid.UUID object
+UUIDStr = Annotated[
+    str,
+    StringConstraints(min_length=36, max_length=36, pattern=UUID_PATTERN),
+    WithJsonSchema({"type": "string", "format": "uuid"}),
+]
@@ -4,7 +4,7 @@
 
 from typing import Any, Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
@@ -18,6 +18,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
     per_page: int = 20
     pages: int = 1
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
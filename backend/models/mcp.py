@@ -6,7 +6,9 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from models._types import JsonDict
 
 
 class MCPTool(BaseModel):
@@ -14,7 +16,19 @@ class MCPTool(BaseModel):
 
     name: str
     description: str
-    parameters: Dict[str, Any] = {}
+    parameters: JsonDict = {}
+
+
+_MCP_SERVER_CREATE_EXAMPLE = {
+    "name": "CML Primary",
+    "type": "cml",
+    "endpoint": "http://cml-mcp-server:8080",
+    "auth_config": {
+        "host": "https://cml.example.com",
+        "username": "admin",
+        "password": "***",
+    },
+}
 
 
 class MCPServerCreate(BaseModel):
@@ -23,21 +37,9 @@ class MCPServerCreate(BaseModel):
     name: str = Field(..., description="Server display name")
     type: str = Field(..., description="Server type: cml, splunk, or custom")
     endpoint: str = Field(..., description="MCP server endpoint URL")
-    auth_config: Dict[str, Any] = Field(default={}, description="Authentication configuration")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "CML Primary",
-                "type": "cml",
-                "endpoint": "http://cml-mcp-server:8080",
-                "auth_config": {
-                    "host": "https://cml.example.com",
-                    "username": "admin",
-                    "password": "***",
-                },
-            }
-        }
+    auth_config: JsonDict = Field(default_factory=dict, description="Authentication configuration")
+
+    model_config = ConfigDict(json_schema_extra={"example": _MCP_SERVER_CREATE_EXAMPLE})
 
 
 class MCPServerUpdate(BaseModel):
@@ -45,7 +47,7 @@ class MCPServerUpdate(BaseModel):
 
     name: Optional[str] = None
     endpoint: Optional[str] = None
-    auth_config: Optional[Dict[str, Any]] = None
+    auth_config: Optional[JsonDict] = None
     is_active: Optional[bool] = None
 
 
@@ -62,8 +64,14 @@ class MCPServerResponse(BaseModel):
     available_tools: List[MCPTool] = []
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+_MCP_TOOL_EXECUTE_EXAMPLE = {
+    "server_id": 1,
+    "tool_name": "get_labs",
+    "parameters": {},
+}
 
 
 class MCPToolExecute(BaseModel):
@@ -71,16 +79,9 @@ class MCPToolExecute(BaseModel):
 
     server_id: int = Field(..., description="MCP server ID")
     tool_name: str = Field(..., description="Tool name to execute")
-    parameters: Dict[str, Any] = Field(default={}, description="Tool parameters")
+    parameters: JsonDict = Field(default_factory=dict, description="Tool parameters")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "server_id": 1,
-                "tool_name": "get_labs",
-                "parameters": {},
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _MCP_TOOL_EXECUTE_EXAMPLE})
 
 
 class MCPToolResponse(BaseModel):
@@ -98,15 +99,15 @@ class CMLTopology(BaseModel):
 
     lab_id: str
     lab_title: str
-    nodes: List[Dict[str, Any]]
-    links: List[Dict[str, Any]]
+    nodes: List[JsonDict]
+    links: List[JsonDict]
 
 
 class SplunkQueryResult(BaseModel):
     """Splunk query result."""
 
     query: str
-    results: List[Dict[str, Any]]
+    results: List[JsonDict]
     result_count: int
     execution_time_ms: int
 
@@ -4,10 +4,12 @@
 # =============================================================================
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from models._types import JsonDict, UUIDStr
 
 
 class NotificationCreate(BaseModel):
@@ -17,7 +19,7 @@ class NotificationCreate(BaseModel):
     recipient: str = Field(..., description="Recipient identifier")
     subject: Optional[str] = Field(None, description="Subject line (for email/ServiceNow)")
     message: str = Field(..., description="Message content")
-    job_id: Optional[UUID] = Field(None, description="Associated pipeline job ID")
+    job_id: Optional[UUIDStr] = Field(None, description="Associated pipeline job ID")
 
 
 class NotificationResponse(BaseModel):
@@ -30,13 +32,17 @@ class NotificationResponse(BaseModel):
     subject: Optional[str] = None
     message: str
     status: str
-    response_data: Optional[Dict[str, Any]] = None
+    response_data: Optional[JsonDict] = None
     error_message: Optional[str] = None
     sent_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+_WEBEX_MESSAGE_EXAMPLE = {
+    "markdown": "**Alert:** OSPF configuration change detected on Router-1\n\n- Area changed from 0 to 10\n- 2 adjacencies flapped",
+}
 
 
 class WebExMessage(BaseModel):
@@ -47,12 +53,16 @@ class WebExMessage(BaseModel):
     markdown: Optional[str] = Field(None, description="Markdown formatted message")
     attachments: Optional[list] = Field(None, description="Adaptive card attachments")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "markdown": "**Alert:** OSPF configuration change detected on Router-1\n\n- Area changed from 0 to 10\n- 2 adjacencies flapped",
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _WEBEX_MESSAGE_EXAMPLE})
+
+
+_SERVICENOW_TICKET_EXAMPLE = {
+    "short_description": "OSPF Configuration Change - Router-1",
+    "description": "Automated configuration change detected.\n\nDetails:\n- Area changed to 10\n- Initiated via voice command",
+    "category": "Network",
+    "subcategory": "Routing",
+    "priority": "3",
+}
 
 
 class ServiceNowTicket(BaseModel):
@@ -66,18 +76,9 @@ class ServiceNowTicket(BaseModel):
     assignment_group: Optional[str] = Field(None, description="Assignment group")
     caller_id: Optional[str] = Field(None, description="Caller user ID")
     cmdb_ci: Optional[str] = Field(None, description="Configuration item")
-    custom_fields: Dict[str, Any] = Field(default={}, description="Additional custom fields")
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "short_description": "OSPF Configuration Change - Router-1",
-                "description": "Automated configuration change detected.\n\nDetails:\n- Area changed to 10\n- Initiated via voice command",
-                "category": "Network",
-                "subcategory": "Routing",
-                "priority": "3",
-            }
-        }
+    custom_fields: JsonDict = Field(default_factory=dict, description="Additional custom fields")
+
+    model_config = ConfigDict(json_schema_extra={"example": _SERVICENOW_TICKET_EXAMPLE})
 
 
 class NotificationTemplate(BaseModel):
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class StageData(BaseModel):
@@ -83,6 +83,10 @@ class OperationSummary(BaseModel):
         from_attributes = True
 
 
+# Built once at import, reused by the list endpoint
+OPERATION_SUMMARY_LIST_ADAPTER = TypeAdapter(List[OperationSummary])
+
+
 class ApprovalRequest(BaseModel):
     """Human approval/rejection request."""
 
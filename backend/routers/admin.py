@@ -3,13 +3,23 @@
 # Configuration and use case management endpoints
 # =============================================================================
 
-from typing import List
+import asyncio
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Tuple
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from jose import jwk, jwt
+from jose.constants import ALGORITHMS
+from passlib.context import CryptContext
+from sqlalchemy import RowMapping, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config import settings
 from db.database import get_db
 from db.models import ConfigVariable, UseCase, User
 from models.admin import (
@@ -24,46 +34,83 @@ from models.admin import (
     LoginRequest,
     TokenResponse,
 )
+from utils.orjson_response import ORJSON_OPTIONS, ORJSONResponse
+from utils.pydantic_response import PydanticResponse
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Shared password hasher; passlib[bcrypt] backs it with the native bcrypt library
+_PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# HS256 signing key built once; jose otherwise re-validates the raw secret on every encode
+_JWT_SIGNING_KEY = jwk.construct(settings.secret_key, ALGORITHMS.HS256)
+
+# Column projections for the read-only list endpoints: Core rows via
+# .mappings() skip ORM instantiation and identity-map bookkeeping
+_CONFIG_COLUMNS = tuple(getattr(ConfigVariable, name) for name in ConfigVariableResponse.model_fields)
+_USE_CASE_COLUMNS = tuple(getattr(UseCase, name) for name in UseCaseResponse.model_fields)
+_USER_COLUMNS = tuple(getattr(User, name) for name in UserResponse.model_fields)
+
 
 # =============================================================================
 # Configuration Variables
 # =============================================================================
+_MASKED_VALUE = "***MASKED***"
+
+# Pre-rendered JSON per config row, keyed by (id, updated_at). The updated_at
+# trigger bumps the key on every write, so stale entries are never hit again;
+# the whole map is dropped once it grows past the bound.
+_CONFIG_FRAGMENTS: Dict[Tuple[int, datetime], bytes] = {}
+_CONFIG_FRAGMENTS_MAX = 4096
+
+
+def _to_config_response(var: ConfigVariable) -> ConfigVariableResponse:
+    """Build the API representation of a config variable, masking secrets."""
+    return ConfigVariableResponse(
+        id=var.id,
+        key=var.key,
+        value=var.value if not var.is_secret else _MASKED_VALUE,
+        description=var.description,
+        category=var.category,
+        is_secret=var.is_secret,
+        created_at=var.created_at,
+        updated_at=var.updated_at,
+    )
+
+
+def _render_config(row: RowMapping) -> bytes:
+    """JSON-encode one config row (secrets masked), memoized per row version."""
+    cache_key = (row["id"], row["updated_at"])
+    fragment = _CONFIG_FRAGMENTS.get(cache_key)
+    if fragment is None:
+        if len(_CONFIG_FRAGMENTS) >= _CONFIG_FRAGMENTS_MAX:
+            _CONFIG_FRAGMENTS.clear()
+        data = {**row, "value": _MASKED_VALUE} if row["is_secret"] else dict(row)
+        fragment = _CONFIG_FRAGMENTS[cache_key] = orjson.dumps(data, option=ORJSON_OPTIONS)
+    return fragment
+
+
 @router.get("/config", response_model=List[ConfigCategory])
 async def get_all_config(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all configuration variables grouped by category."""
     result = await db.execute(
-        select(ConfigVariable).order_by(ConfigVariable.category, ConfigVariable.key)
+        select(*_CONFIG_COLUMNS).order_by(ConfigVariable.category, ConfigVariable.key)
     )
-    variables = result.scalars().all()
-
-    # Group by category
-    categories = {}
-    for var in variables:
-        if var.category not in categories:
-            categories[var.category] = []
-        categories[var.category].append(
-            ConfigVariableResponse(
-                id=var.id,
-                key=var.key,
-                value=var.value if not var.is_secret else "***MASKED***",
-                description=var.description,
-                category=var.category,
-                is_secret=var.is_secret,
-                created_at=var.created_at,
-                updated_at=var.updated_at,
-            )
+    rows = result.mappings().all()
+
+    # Rows are ordered by category, so groupby yields each category exactly once;
+    # the body is stitched together from the cached per-row fragments
+    body = b",".join(
+        b'{"category":%s,"variables":[%s]}' % (
+            orjson.dumps(cat),
+            b",".join(_render_config(row) for row in group),
         )
-
-    return [
-        ConfigCategory(category=cat, variables=vars)
-        for cat, vars in categories.items()
-    ]
+        for cat, group in groupby(rows, key=itemgetter("category"))
+    )
+    return Response(content=b"[%s]" % body, media_type="application/json")
 
 
 @router.get("/config/runtime")
@@ -101,16 +148,7 @@ async def get_config_variable(
             detail=f"Configuration variable '{key}' not found",
         )
 
-    return ConfigVariableResponse(
-        id=var.id,
-        key=var.key,
-        value=var.value if not var.is_secret else "***MASKED***",
-        description=var.description,
-        category=var.category,
-        is_secret=var.is_secret,
-        created_at=var.created_at,
-        updated_at=var.updated_at,
-    )
+    return PydanticResponse(_to_config_response(var))
 
 
 @router.post("/config", response_model=ConfigVariableResponse, status_code=status.HTTP_201_CREATED)
@@ -119,40 +157,22 @@ async def create_config_variable(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new configuration variable."""
-    # Check if key exists
-    result = await db.execute(select(ConfigVariable).where(ConfigVariable.key == config.key))
-    existing = result.scalar_one_or_none()
-
-    if existing:
+    # Single INSERT ... RETURNING; the unique constraint on key reports duplicates
+    try:
+        result = await db.execute(
+            insert(ConfigVariable).values(**config.model_dump()).returning(ConfigVariable)
+        )
+        var = result.scalar_one()
+        await db.commit()
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Configuration variable '{config.key}' already exists",
         )
 
-    var = ConfigVariable(
-        key=config.key,
-        value=config.value,
-        description=config.description,
-        category=config.category,
-        is_secret=config.is_secret,
-    )
-
-    db.add(var)
-    await db.commit()
-    await db.refresh(var)
-
     logger.info("Config variable created", key=config.key, category=config.category)
 
-    return ConfigVariableResponse(
-        id=var.id,
-        key=var.key,
-        value=var.value if not var.is_secret else "***MASKED***",
-        description=var.description,
-        category=var.category,
-        is_secret=var.is_secret,
-        created_at=var.created_at,
-        updated_at=var.updated_at,
-    )
+    return _to_config_response(var)
 
 
 @router.put("/config/{key}", response_model=ConfigVariableResponse)
@@ -183,16 +203,7 @@ async def update_config_variable(
 
     logger.info("Config variable updated", key=key)
 
-    return ConfigVariableResponse(
-        id=var.id,
-        key=var.key,
-        value=var.value if not var.is_secret else "***MASKED***",
-        description=var.description,
-        category=var.category,
-        is_secret=var.is_secret,
-        created_at=var.created_at,
-        updated_at=var.updated_at,
-    )
+    return _to_config_response(var)
 
 
 @router.delete("/config/{key}")
@@ -227,15 +238,14 @@ async def list_use_cases(
     db: AsyncSession = Depends(get_db),
 ):
     """List all use cases."""
-    query = select(UseCase).order_by(UseCase.sort_order, UseCase.name)
+    query = select(*_USE_CASE_COLUMNS).order_by(UseCase.sort_order, UseCase.name)
 
     if not include_inactive:
         query = query.where(UseCase.is_active == True)
 
     result = await db.execute(query)
-    use_cases = result.scalars().all()
 
-    return [UseCaseResponse.model_validate(uc) for uc in use_cases]
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.get("/use-cases/{use_case_id}", response_model=UseCaseResponse)
@@ -253,7 +263,7 @@ async def get_use_case(
             detail=f"Use case {use_case_id} not found",
         )
 
-    return UseCaseResponse.model_validate(uc)
+    return PydanticResponse(UseCaseResponse.model_validate(uc))
 
 
 @router.post("/use-cases", response_model=UseCaseResponse, status_code=status.HTTP_201_CREATED)
@@ -262,60 +272,45 @@ async def create_use_case(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new use case."""
-    # Check if name exists
-    result = await db.execute(select(UseCase).where(UseCase.name == use_case.name))
-    existing = result.scalar_one_or_none()
-
-    if existing:
+    # Single INSERT ... RETURNING; the unique constraint on name reports duplicates.
+    # Unset optional fields are omitted (not sent as NULL) so the column
+    # defaults for templates, checks and risk_profile still apply.
+    try:
+        result = await db.execute(
+            insert(UseCase).values(**use_case.model_dump(exclude_none=True)).returning(UseCase)
+        )
+        uc = result.scalar_one()
+        await db.commit()
+    except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Use case '{use_case.name}' already exists",
         )
 
-    uc = UseCase(
-        name=use_case.name,
-        display_name=use_case.display_name,
-        description=use_case.description,
-        trigger_keywords=use_case.trigger_keywords,
-        intent_prompt=use_case.intent_prompt,
-        config_prompt=use_case.config_prompt,
-        analysis_prompt=use_case.analysis_prompt,
-        notification_template=use_case.notification_template,
-        cml_target_lab=use_case.cml_target_lab,
-        splunk_index=use_case.splunk_index,
-        convergence_wait_seconds=use_case.convergence_wait_seconds,
-        servicenow_enabled=use_case.servicenow_enabled,
-        allowed_actions=use_case.allowed_actions,
-        scope_validation_enabled=use_case.scope_validation_enabled,
-        llm_provider=use_case.llm_provider,
-        llm_model=use_case.llm_model,
-        explanation_template=use_case.explanation_template,
-        impact_description=use_case.impact_description,
-        splunk_query_config=use_case.splunk_query_config,
-        pre_checks=use_case.pre_checks,
-        post_checks=use_case.post_checks,
-        risk_profile=use_case.risk_profile,
-        is_active=use_case.is_active,
-        sort_order=use_case.sort_order,
-    )
-
-    db.add(uc)
-    await db.commit()
-    await db.refresh(uc)
-
     logger.info("Use case created", name=use_case.name)
 
-    return UseCaseResponse.model_validate(uc)
+    return PydanticResponse(UseCaseResponse.model_validate(uc), status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/use-cases/{use_case_id}", response_model=UseCaseResponse)
 async def update_use_case(
     use_case_id: int,
-    update: UseCaseUpdate,
+    changes: UseCaseUpdate,
     db: AsyncSession = Depends(get_db),
 ):
     """Update a use case."""
-    result = await db.execute(select(UseCase).where(UseCase.id == use_case_id))
+    values = changes.model_dump(exclude_unset=True, exclude_none=True)
+
+    if values:
+        # Single UPDATE ... RETURNING touching only the supplied columns
+        result = await db.execute(
+            update(UseCase)
+            .where(UseCase.id == use_case_id)
+            .values(**values)
+            .returning(UseCase)
+        )
+    else:
+        result = await db.execute(select(UseCase).where(UseCase.id == use_case_id))
     uc = result.scalar_one_or_none()
 
     if not uc:
@@ -324,51 +319,12 @@ async def update_use_case(
             detail=f"Use case {use_case_id} not found",
         )
 
-    if update.display_name is not None:
-        uc.display_name = update.display_name
-    if update.description is not None:
-        uc.description = update.description
-    if update.trigger_keywords is not None:
-        uc.trigger_keywords = update.trigger_keywords
-    if update.intent_prompt is not None:
-        uc.intent_prompt = update.intent_prompt
-    if update.config_prompt is not None:
-        uc.config_prompt = update.config_prompt
-    if update.analysis_prompt is not None:
-        uc.analysis_prompt = update.analysis_prompt
-    if update.notification_template is not None:
-        uc.notification_template = update.notification_template
-    if update.cml_target_lab is not None:
-        uc.cml_target_lab = update.cml_target_lab
-    if update.splunk_index is not None:
-        uc.splunk_index = update.splunk_index
-    if update.convergence_wait_seconds is not None:
-        uc.convergence_wait_seconds = update.convergence_wait_seconds
-    if update.servicenow_enabled is not None:
-        uc.servicenow_enabled = update.servicenow_enabled
-    if update.explanation_template is not None:
-        uc.explanation_template = update.explanation_template
-    if update.impact_description is not None:
-        uc.impact_description = update.impact_description
-    if update.splunk_query_config is not None:
-        uc.splunk_query_config = update.splunk_query_config
-    if update.pre_checks is not None:
-        uc.pre_checks = update.pre_checks
-    if update.post_checks is not None:
-        uc.post_checks = update.post_checks
-    if update.risk_profile is not None:
-        uc.risk_profile = update.risk_profile
-    if update.is_active is not None:
-        uc.is_active = update.is_active
-    if update.sort_order is not None:
-        uc.sort_order = update.sort_order
-
+    response = UseCaseResponse.model_validate(uc)
     await db.commit()
-    await db.refresh(uc)
 
     logger.info("Use case updated", id=use_case_id)
 
-    return UseCaseResponse.model_validate(uc)
+    return PydanticResponse(response)
 
 
 @router.delete("/use-cases/{use_case_id}")
@@ -402,22 +358,12 @@ async def list_users(
     db: AsyncSession = Depends(get_db),
 ):
     """List all users."""
-    result = await db.execute(select(User).order_by(User.username))
-    users = result.scalars().all()
-
-    return [
-        UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            full_name=user.full_name,
-            role=user.role if isinstance(user.role, str) else user.role.value,
-            is_active=user.is_active,
-            last_login=user.last_login,
-            created_at=user.created_at,
-        )
-        for user in users
-    ]
+    result = await db.execute(select(*_USER_COLUMNS).order_by(User.username))
+
+    # Rows are trusted; encode plain dicts once instead of validating UserResponse
+    # models and running them through jsonable_encoder (orjson writes the
+    # UserRole enum and datetimes natively)
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -426,28 +372,25 @@ async def login(
     db: AsyncSession = Depends(get_db),
 ):
     """Authenticate user and return JWT token."""
-    from passlib.hash import bcrypt
-    from jose import jwt
-    from datetime import datetime, timedelta
-
     result = await db.execute(
         select(User).where(User.username == request.username, User.is_active == True)
     )
     user = result.scalar_one_or_none()
 
-    if not user or not bcrypt.verify(request.password, user.password_hash):
+    # bcrypt is deliberately slow; verify in a worker thread to keep the event loop free
+    if not user or not await asyncio.to_thread(_PWD_CONTEXT.verify, request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
         )
 
     # Update last login
-    user.last_login = datetime.utcnow()
+    await db.execute(
+        update(User).where(User.id == user.id).values(last_login=datetime.utcnow())
+    )
     await db.commit()
 
     # Generate JWT
-    from config import settings
-
     from services.config_service import ConfigService
     jwt_expiry = await ConfigService.get_config(db, "operational.jwt_expiry_seconds", 86400)
     expires = datetime.utcnow() + timedelta(seconds=int(jwt_expiry))
@@ -456,7 +399,7 @@ async def login(
         "role": user.role.value,
         "exp": expires,
     }
-    token = jwt.encode(token_data, settings.secret_key, algorithm="HS256")
+    token = jwt.encode(token_data, _JWT_SIGNING_KEY, algorithm=ALGORITHMS.HS256)
 
     logger.info("User logged in", username=user.username)
 
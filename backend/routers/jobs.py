@@ -3,105 +3,100 @@
 # Job queue status and management endpoints
 # =============================================================================
 
+import re
 from typing import List, Optional
 from datetime import datetime, timedelta
 
 import structlog
-from arq import create_pool
-from arq.connections import RedisSettings
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import JSON, case, delete, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config import settings
 from db.database import get_db
 from db.models import PipelineJob
+from models._types import UUID_PATTERN
+from services.job_queue import get_arq_pool
+from utils.orjson_response import ORJSONResponse
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+_JOB_STATUSES = ('pending', 'queued', 'running', 'paused', 'completed', 'failed', 'cancelled')
+_VALID_STATUSES = frozenset(_JOB_STATUSES)
+_VALID_STATUSES_TEXT = ', '.join(_JOB_STATUSES)
+_RETRYABLE_STATUSES = frozenset({'failed', 'cancelled'})
+_UUID_RE = re.compile(UUID_PATTERN)
+
 
 @router.get("/stats")
 async def get_job_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get job queue statistics."""
+    one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+
     # Count jobs by status
-    result = await db.execute(
-        select(PipelineJob.status, func.count(PipelineJob.id))
+    status_counts = (
+        select(PipelineJob.status, func.count().label("count"))
         .group_by(PipelineJob.status)
+        .subquery()
     )
-    status_counts = dict(result.all())
-
-    # Recent job counts (last hour)
-    one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-    result = await db.execute(
-        select(func.count(PipelineJob.id))
-        .where(PipelineJob.created_at >= one_hour_ago)
-    )
-    recent_count = result.scalar() or 0
 
-    # Average completion time for successful jobs
+    # Status counts, recent job count (last hour) and average completion time
+    # for successful jobs, fetched in a single round-trip
     result = await db.execute(
-        select(func.avg(
-            func.extract('epoch', PipelineJob.completed_at - PipelineJob.started_at)
-        ))
-        .where(
-            PipelineJob.status == 'completed',
-            PipelineJob.completed_at.isnot(None),
-            PipelineJob.started_at.isnot(None),
+        select(
+            select(
+                func.json_object_agg(status_counts.c.status, status_counts.c.count, type_=JSON)
+            ).scalar_subquery().label("by_status"),
+            select(func.count())
+            .select_from(PipelineJob)
+            .where(PipelineJob.created_at >= one_hour_ago)
+            .scalar_subquery().label("recent_count"),
+            select(func.avg(
+                func.extract('epoch', PipelineJob.completed_at - PipelineJob.started_at)
+            ))
+            .where(
+                PipelineJob.status == 'completed',
+                PipelineJob.completed_at.isnot(None),
+                PipelineJob.started_at.isnot(None),
+            )
+            .scalar_subquery().label("avg_duration"),
         )
     )
-    avg_duration = result.scalar()
+    stats = result.one()
+    by_status = stats.by_status or {}
 
-    return {
-        "by_status": {
-            status.value if hasattr(status, 'value') else status: count
-            for status, count in status_counts.items()
-        },
-        "recent_count": recent_count,
-        "average_duration_seconds": round(avg_duration, 2) if avg_duration else None,
-        "total": sum(status_counts.values()),
-    }
+    return ORJSONResponse({
+        "by_status": by_status,
+        "recent_count": stats.recent_count or 0,
+        "average_duration_seconds": round(float(stats.avg_duration), 2) if stats.avg_duration else None,
+        "total": sum(by_status.values()),
+    })
 
 
 @router.get("/queue")
-async def get_queue_info():
+async def get_queue_info(request: Request):
     """Get information about the arq job queue."""
     try:
-        redis_pool = await create_pool(
-            RedisSettings(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                password=settings.redis_password or None,
-            )
-        )
-
         # Get queue info from Redis
         # arq stores jobs in various keys
-        import redis.asyncio as redis
-
-        r = redis.Redis(
-            host=settings.redis_host,
-            port=settings.redis_port,
-            password=settings.redis_password or None,
-        )
+        r = await get_arq_pool(request)
 
         # Get pending jobs count
         queue_length = await r.llen("arq:queue")
 
         # Get running jobs (approximation)
-        # arq uses job_id keys with prefix
-        running_keys = []
-        async for key in r.scan_iter(match="arq:job:*"):
-            running_keys.append(key)
-
-        await r.close()
-        await redis_pool.close()
+        # arq uses job_id keys with prefix. Iterate with client-side SCAN in
+        # large pages: each page is a short command, so Redis keeps serving
+        # other clients in between (a server-side loop would block it)
+        active_jobs = 0
+        async for _ in r.scan_iter(match="arq:job:*", count=1000):
+            active_jobs += 1
 
         return {
             "queue_length": queue_length,
-            "active_jobs": len(running_keys),
+            "active_jobs": active_jobs,
             "redis_connected": True,
         }
 
@@ -118,20 +113,18 @@ async def get_queue_info():
 @router.post("/{job_id}/retry")
 async def retry_job(
     job_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Retry a failed job."""
-    from uuid import UUID
-
-    try:
-        job_uuid = UUID(job_id)
-    except ValueError:
+    # Format check only; asyncpg binds the text form straight to the uuid column
+    if not _UUID_RE.match(job_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid job ID format",
         )
 
-    result = await db.execute(select(PipelineJob).where(PipelineJob.id == job_uuid))
+    result = await db.execute(select(PipelineJob).where(PipelineJob.id == job_id))
     job = result.scalar_one_or_none()
 
     if not job:
@@ -140,7 +133,7 @@ async def retry_job(
             detail=f"Job {job_id} not found",
         )
 
-    if job.status not in ['failed', 'cancelled']:
+    if job.status not in _RETRYABLE_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Can only retry failed or cancelled jobs (current status: {job.status})",
@@ -161,18 +154,11 @@ async def retry_job(
 
     # Enqueue job
     try:
-        redis_pool = await create_pool(
-            RedisSettings(
-                host=settings.redis_host,
-                port=settings.redis_port,
-                password=settings.redis_password or None,
-            )
-        )
+        redis_pool = await get_arq_pool(request)
         await redis_pool.enqueue_job(
             "process_pipeline_job",
             job_id,
         )
-        await redis_pool.close()
 
         logger.info("Job retried", job_id=job_id, retry_count=job.retry_count)
 
@@ -201,25 +187,16 @@ async def clear_completed_jobs(
         older_than_hours = int(older_than_hours)
     cutoff = datetime.utcnow() - timedelta(hours=older_than_hours)
 
+    # Single DELETE; the affected-row count comes back in the command tag
     result = await db.execute(
-        select(func.count(PipelineJob.id))
+        delete(PipelineJob)
         .where(
             PipelineJob.status.in_(['completed', 'cancelled']),
             PipelineJob.completed_at < cutoff,
         )
     )
-    count = result.scalar() or 0
-
-    if count > 0:
-        from sqlalchemy import delete
-        await db.execute(
-            delete(PipelineJob)
-            .where(
-                PipelineJob.status.in_(['completed', 'cancelled']),
-                PipelineJob.completed_at < cutoff,
-            )
-        )
-        await db.commit()
+    count = result.rowcount
+    await db.commit()
 
     logger.info("Cleared completed jobs", count=count, older_than_hours=older_than_hours)
 
@@ -237,35 +214,47 @@ async def get_recent_jobs(
     db: AsyncSession = Depends(get_db),
 ):
     """Get recent jobs with optional status filter."""
-    query = select(PipelineJob).order_by(PipelineJob.created_at.desc())
+    # Project only the summary columns and truncate input_text in Postgres. With
+    # STORAGE EXTERNAL on input_text, octet_length() is answered from the TOAST
+    # pointer and left() fetches only a leading slice; char_length() on the full
+    # value would detoast all of it, so it is only applied to that slice.
+    query = (
+        select(
+            PipelineJob.id,
+            PipelineJob.use_case_name.label("use_case"),
+            case(
+                (func.octet_length(PipelineJob.input_text) <= 100, PipelineJob.input_text),
+                (
+                    func.char_length(func.left(PipelineJob.input_text, 101)) > 100,
+                    func.left(PipelineJob.input_text, 100).concat("..."),
+                ),
+                else_=PipelineJob.input_text,
+            ).label("input_text"),
+            PipelineJob.current_stage,
+            PipelineJob.status,
+            PipelineJob.created_at,
+            PipelineJob.started_at,
+            PipelineJob.completed_at,
+            PipelineJob.error_message.label("error"),
+        )
+        .order_by(PipelineJob.created_at.desc())
+    )
 
     if status_filter:
-        valid_statuses = ['pending', 'queued', 'running', 'paused', 'completed', 'failed', 'cancelled']
-        if status_filter.lower() not in valid_statuses:
+        status_value = status_filter.lower()
+        if status_value not in _VALID_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status_filter}. Must be one of: {', '.join(valid_statuses)}",
+                detail=f"Invalid status: {status_filter}. Must be one of: {_VALID_STATUSES_TEXT}",
             )
-        query = query.where(PipelineJob.status == status_filter.lower())
+        query = query.where(PipelineJob.status == status_value)
 
     query = query.limit(limit)
     result = await db.execute(query)
-    jobs = result.scalars().all()
+    jobs = result.mappings().all()
 
-    return {
-        "jobs": [
-            {
-                "id": str(job.id),
-                "use_case": job.use_case_name,
-                "input_text": job.input_text[:100] + "..." if len(job.input_text) > 100 else job.input_text,
-                "current_stage": job.current_stage,
-                "status": job.status,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-                "started_at": job.started_at.isoformat() if job.started_at else None,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "error": job.error_message,
-            }
-            for job in jobs
-        ],
+    # Encoded once by orjson (UUIDs and datetimes natively), bypassing jsonable_encoder
+    return ORJSONResponse({
+        "jobs": [dict(job) for job in jobs],
         "count": len(jobs),
-    }
+    })
@@ -3,15 +3,26 @@
 # MCP server management and tool execution endpoints
 # =============================================================================
 
-from typing import List
-
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from config import settings
 from db.database import get_db
-from db.models import MCPServer
+from db.models import MCPServer, MCPServerType
 from models.mcp import (
     MCPServerCreate,
     MCPServerUpdate,
@@ -26,37 +37,170 @@ from models.mcp import (
     LabActionResponse,
 )
 from services.cml_client import CMLClient
+from services.config_service import ConfigService
 from services.splunk_client import SplunkClient
+from utils.orjson_response import ORJSONResponse
+from utils.pydantic_response import PydanticResponse
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Column projection for the list endpoint: Core rows skip ORM instantiation
+_SERVER_COLUMNS = tuple(getattr(MCPServer, name) for name in MCPServerResponse.model_fields)
+# Same column set for single-row ORM loads; any other attribute access raises
+# instead of silently issuing a lazy SELECT
+_RESPONSE_COLUMNS_ONLY = load_only(*_SERVER_COLUMNS, raiseload=True)
+
+# Per-id statements built once and executed with {"server_id": ...}; the
+# bound parameter keeps one compiled form in SQLAlchemy's cache and one
+# prepared statement per asyncpg connection
+_SERVER_BY_ID = (
+    select(MCPServer)
+    .where(MCPServer.id == bindparam("server_id"))
+    .options(_RESPONSE_COLUMNS_ONLY)
+)
+_SERVER_PROBE_BY_ID = select(
+    MCPServer.name, MCPServer.type, MCPServer.endpoint, MCPServer.auth_config
+).where(MCPServer.id == bindparam("server_id"))
+_SERVER_FOR_TOOL_BY_ID = (
+    select(MCPServer)
+    .where(MCPServer.id == bindparam("server_id"))
+    .options(load_only(
+        MCPServer.name,
+        MCPServer.type,
+        MCPServer.endpoint,
+        MCPServer.auth_config,
+        MCPServer.is_active,
+        raiseload=True,
+    ))
+)
+_DELETE_SERVER_BY_ID = (
+    delete(MCPServer)
+    .where(MCPServer.id == bindparam("server_id"))
+    .returning(MCPServer.name)
+)
+
+
+# =============================================================================
+# Active Server Lookup
+# =============================================================================
+@dataclass(frozen=True)
+class ActiveServer:
+    """Detached snapshot of the active MCP server of a given type."""
+
+    id: int
+    name: str
+    endpoint: str
+    auth_config: Dict[str, Any]
+
+
+# Every CML/Splunk endpoint needs the same "active server of type X" row, which
+# changes only through the registry endpoints below. Keep it per process for a
+# short TTL; the registry endpoints drop the cache whenever they write.
+_ACTIVE_SERVER_TTL = 30.0
+_ACTIVE_SERVER_CACHE: Dict[MCPServerType, Tuple[float, ActiveServer]] = {}
+
+# Lookup statements built once per server type rather than per call
+_ACTIVE_SERVER_QUERIES = {
+    server_type: select(MCPServer.id, MCPServer.name, MCPServer.endpoint, MCPServer.auth_config).where(
+        MCPServer.type == server_type,
+        MCPServer.is_active == True,
+    )
+    for server_type in MCPServerType
+}
+
+
+async def get_active_server(db: AsyncSession, server_type: MCPServerType) -> Optional[ActiveServer]:
+    """Return the active MCP server of the given type, or None if there is none."""
+    now = time.monotonic()
+    cached = _ACTIVE_SERVER_CACHE.get(server_type)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    result = await db.execute(_ACTIVE_SERVER_QUERIES[server_type])
+    row = result.one_or_none()
+
+    # Misses are not cached so a newly registered server is picked up immediately
+    if row is None:
+        _ACTIVE_SERVER_CACHE.pop(server_type, None)
+        return None
+
+    server = ActiveServer(id=row.id, name=row.name, endpoint=row.endpoint, auth_config=row.auth_config)
+    _ACTIVE_SERVER_CACHE[server_type] = (now + _ACTIVE_SERVER_TTL, server)
+    return server
+
+
+def _invalidate_active_servers() -> None:
+    """Drop cached active-server lookups and clients after a registry write."""
+    _ACTIVE_SERVER_CACHE.clear()
+    _cml_client.cache_clear()
+    _splunk_client.cache_clear()
+
+
+# Clients are immutable once built, so one instance per (endpoint, credentials)
+# is shared across requests. auth_config is keyed by its canonical JSON bytes.
+def _auth_key(auth_config: Optional[Dict[str, Any]]) -> bytes:
+    return orjson.dumps(auth_config or {}, option=orjson.OPT_SORT_KEYS)
+
+
+@lru_cache(maxsize=32)
+def _cml_client(endpoint: str, auth_key: bytes) -> CMLClient:
+    return CMLClient(endpoint, orjson.loads(auth_key))
+
+
+@lru_cache(maxsize=32)
+def _splunk_client(endpoint: str, auth_key: bytes) -> SplunkClient:
+    return SplunkClient(endpoint, orjson.loads(auth_key))
+
+
+def get_cml_client(server: Any) -> CMLClient:
+    """Shared CMLClient for a server row or ActiveServer snapshot."""
+    return _cml_client(server.endpoint, _auth_key(server.auth_config))
+
+
+def get_splunk_client(server: Any) -> SplunkClient:
+    """Shared SplunkClient for a server row or ActiveServer snapshot."""
+    return _splunk_client(server.endpoint, _auth_key(server.auth_config))
+
+
+# Server types that have a tool client; MCPServerType is a str enum, so rows
+# and plain "cml"/"splunk" strings both hit the same entries
+_CLIENT_GETTERS: Dict[MCPServerType, Callable[[Any], Any]] = {
+    MCPServerType.CML: get_cml_client,
+    MCPServerType.SPLUNK: get_splunk_client,
+}
+
 
 # =============================================================================
 # MCP Server Management
 # =============================================================================
+def _to_server_response(server: MCPServer) -> MCPServerResponse:
+    """Build the response from a loaded row; rendered via PydanticResponse."""
+    return MCPServerResponse(
+        id=server.id,
+        name=server.name,
+        type=server.type,
+        endpoint=server.endpoint,
+        is_active=server.is_active,
+        health_status=server.health_status,
+        last_health_check=server.last_health_check,
+        available_tools=server.available_tools or [],
+        created_at=server.created_at,
+    )
+
+
 @router.get("/servers", response_model=List[MCPServerResponse])
 async def list_mcp_servers(
     db: AsyncSession = Depends(get_db),
 ):
     """List all registered MCP servers."""
-    result = await db.execute(select(MCPServer).order_by(MCPServer.name))
-    servers = result.scalars().all()
-
-    return [
-        MCPServerResponse(
-            id=server.id,
-            name=server.name,
-            type=server.type,
-            endpoint=server.endpoint,
-            is_active=server.is_active,
-            health_status=server.health_status,
-            last_health_check=server.last_health_check,
-            available_tools=server.available_tools or [],
-            created_at=server.created_at,
-        )
-        for server in servers
-    ]
+    result = await db.execute(select(*_SERVER_COLUMNS).order_by(MCPServer.name))
+
+    # Plain row dicts encoded once by orjson (enums and datetimes natively)
+    return ORJSONResponse([
+        {**row, "available_tools": row["available_tools"] or []}
+        for row in result.mappings()
+    ])
 
 
 @router.post("/servers", response_model=MCPServerResponse, status_code=status.HTTP_201_CREATED)
@@ -74,43 +218,33 @@ async def create_mcp_server(
             detail=f"Invalid server type: {server_data.type}. Must be: cml, splunk, or custom",
         )
 
-    # Check for duplicate name + type combination
-    existing = await db.execute(
-        select(MCPServer).where(
-            MCPServer.name == server_data.name,
-            MCPServer.type == server_type,
-        )
+    # Single INSERT ... ON CONFLICT DO NOTHING RETURNING against the unique
+    # (name, type) index; no row back means the server already exists
+    result = await db.execute(
+        pg_insert(MCPServer)
+        .values(
+            name=server_data.name,
+            type=server_type,
+            endpoint=server_data.endpoint,
+            auth_config=server_data.auth_config,
+        )
+        .on_conflict_do_nothing(index_elements=[MCPServer.name, MCPServer.type])
+        .returning(MCPServer)
     )
-    if existing.scalar_one_or_none():
+    server = result.scalar_one_or_none()
+
+    if server is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"MCP server '{server_data.name}' of type '{server_type}' already exists",
         )
 
-    server = MCPServer(
-        name=server_data.name,
-        type=server_type,
-        endpoint=server_data.endpoint,
-        auth_config=server_data.auth_config,
-    )
-
-    db.add(server)
     await db.commit()
-    await db.refresh(server)
+    _invalidate_active_servers()
 
     logger.info("MCP server created", name=server.name, type=server.type)
 
-    return MCPServerResponse(
-        id=server.id,
-        name=server.name,
-        type=server.type,
-        endpoint=server.endpoint,
-        is_active=server.is_active,
-        health_status=server.health_status,
-        last_health_check=server.last_health_check,
-        available_tools=[],
-        created_at=server.created_at,
-    )
+    return PydanticResponse(_to_server_response(server), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/servers/{server_id}", response_model=MCPServerResponse)
@@ -119,7 +253,7 @@ async def get_mcp_server(
     db: AsyncSession = Depends(get_db),
 ):
     """Get details of a specific MCP server."""
-    result = await db.execute(select(MCPServer).where(MCPServer.id == server_id))
+    result = await db.execute(_SERVER_BY_ID, {"server_id": server_id})
     server = result.scalar_one_or_none()
 
     if not server:
@@ -128,17 +262,7 @@ async def get_mcp_server(
             detail=f"MCP server {server_id} not found",
         )
 
-    return MCPServerResponse(
-        id=server.id,
-        name=server.name,
-        type=server.type,
-        endpoint=server.endpoint,
-        is_active=server.is_active,
-        health_status=server.health_status,
-        last_health_check=server.last_health_check,
-        available_tools=server.available_tools or [],
-        created_at=server.created_at,
-    )
+    return PydanticResponse(_to_server_response(server))
 
 
 @router.put("/servers/{server_id}", response_model=MCPServerResponse)
@@ -148,7 +272,18 @@ async def update_mcp_server(
     db: AsyncSession = Depends(get_db),
 ):
     """Update an MCP server configuration."""
-    result = await db.execute(select(MCPServer).where(MCPServer.id == server_id))
+    values = server_data.model_dump(exclude_unset=True, exclude_none=True)
+
+    if values:
+        # Single UPDATE ... RETURNING touching only the supplied columns
+        result = await db.execute(
+            update(MCPServer)
+            .where(MCPServer.id == server_id)
+            .values(**values)
+            .returning(MCPServer)
+        )
+    else:
+        result = await db.execute(_SERVER_BY_ID, {"server_id": server_id})
     server = result.scalar_one_or_none()
 
     if not server:
@@ -157,55 +292,39 @@ async def update_mcp_server(
             detail=f"MCP server {server_id} not found",
         )
 
-    if server_data.name is not None:
-        server.name = server_data.name
-    if server_data.endpoint is not None:
-        server.endpoint = server_data.endpoint
-    if server_data.auth_config is not None:
-        server.auth_config = server_data.auth_config
-    if server_data.is_active is not None:
-        server.is_active = server_data.is_active
-
     await db.commit()
-    await db.refresh(server)
+    _invalidate_active_servers()
 
     logger.info("MCP server updated", id=server_id)
 
-    return MCPServerResponse(
-        id=server.id,
-        name=server.name,
-        type=server.type,
-        endpoint=server.endpoint,
-        is_active=server.is_active,
-        health_status=server.health_status,
-        last_health_check=server.last_health_check,
-        available_tools=server.available_tools or [],
-        created_at=server.created_at,
-    )
+    return PydanticResponse(_to_server_response(server))
 
 
-@router.delete("/servers/{server_id}", status_code=status.HTTP_200_OK)
+@router.delete("/servers/{server_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_mcp_server(
     server_id: int,
     db: AsyncSession = Depends(get_db),
 ):
     """Delete an MCP server from the registry."""
-    result = await db.execute(select(MCPServer).where(MCPServer.id == server_id))
-    server = result.scalar_one_or_none()
+    result = await db.execute(_DELETE_SERVER_BY_ID, {"server_id": server_id})
+    server_name = result.scalar_one_or_none()
 
-    if not server:
+    if server_name is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"MCP server {server_id} not found",
         )
 
-    server_name = server.name
-    await db.delete(server)
     await db.commit()
+    _invalidate_active_servers()
 
     logger.info("MCP server deleted", id=server_id, name=server_name)
 
-    return {"success": True, "message": f"MCP server '{server_name}' deleted"}
+    return Response(
+        status_code=status.HTTP_204_NO_CONTENT,
+        # Header values are latin-1; percent-encode so any name is safe
+        headers={"X-Deleted-Name": quote(server_name)},
+    )
 
 
 @router.post("/servers/{server_id}/test")
@@ -214,10 +333,8 @@ async def test_mcp_server(
     db: AsyncSession = Depends(get_db),
 ):
     """Test connection to an MCP server."""
-    from datetime import datetime
-
-    result = await db.execute(select(MCPServer).where(MCPServer.id == server_id))
-    server = result.scalar_one_or_none()
+    result = await db.execute(_SERVER_PROBE_BY_ID, {"server_id": server_id})
+    server = result.one_or_none()
 
     if not server:
         raise HTTPException(
@@ -227,41 +344,46 @@ async def test_mcp_server(
 
     logger.info("Testing MCP server connection", name=server.name)
 
+    error: Optional[Exception] = None
+    tools: List[Dict[str, Any]] = []
+    get_client = _CLIENT_GETTERS.get(server.type)
     try:
-        if server.type == "cml":
-            client = CMLClient(server.endpoint, server.auth_config)
-            tools = await client.list_tools()
-        elif server.type == "splunk":
-            client = SplunkClient(server.endpoint, server.auth_config)
-            tools = await client.list_tools()
-        else:
-            tools = []
-
-        server.health_status = 'healthy'
-        server.last_health_check = datetime.utcnow()
-        server.available_tools = tools
-        await db.commit()
-
-        return {
-            "success": True,
-            "message": "Connection successful",
-            "tools_count": len(tools),
-            "tools": tools,
-        }
-
+        if get_client is not None:
+            tools = await asyncio.wait_for(
+                get_client(server).list_tools(), timeout=settings.mcp_test_timeout
+            )
+    except asyncio.TimeoutError:
+        logger.error("MCP server test timed out", timeout=settings.mcp_test_timeout)
+        error = TimeoutError(f"no response within {settings.mcp_test_timeout}s")
     except Exception as e:
         logger.error("MCP server test failed", error=str(e))
+        error = e
 
-        server.health_status = 'unhealthy'
-        server.last_health_check = datetime.utcnow()
-        await db.commit()
+    # Both outcomes record their health in the same single UPDATE
+    health: Dict[str, Any] = {"last_health_check": datetime.utcnow()}
+    if error is None:
+        health.update(health_status='healthy', available_tools=tools)
+    else:
+        health.update(health_status='unhealthy')
 
-        return {
+    await db.execute(update(MCPServer).where(MCPServer.id == server_id).values(**health))
+    await db.commit()
+    _invalidate_active_servers()
+
+    if error is not None:
+        return ORJSONResponse({
             "success": False,
-            "message": f"Connection failed: {str(e)}",
+            "message": f"Connection failed: {str(error)}",
             "tools_count": 0,
             "tools": [],
-        }
+        })
+
+    return ORJSONResponse({
+        "success": True,
+        "message": "Connection successful",
+        "tools_count": len(tools),
+        "tools": tools,
+    })
 
 
 # =============================================================================
@@ -273,21 +395,23 @@ async def list_all_tools(
 ):
     """List all available tools from all active MCP servers."""
     result = await db.execute(
-        select(MCPServer).where(MCPServer.is_active == True)
+        select(MCPServer.id, MCPServer.name, MCPServer.type, MCPServer.available_tools)
+        .where(MCPServer.is_active == True)
     )
-    servers = result.scalars().all()
 
-    all_tools = []
-    for server in servers:
-        for tool in server.available_tools or []:
-            all_tools.append({
-                "server_id": server.id,
-                "server_name": server.name,
-                "server_type": server.type,
-                **tool,
-            })
+    # Rows unpack as plain tuples; one flat comprehension, no per-server list appends
+    all_tools = [
+        {
+            "server_id": server_id,
+            "server_name": server_name,
+            "server_type": server_type,
+            **tool,
+        }
+        for server_id, server_name, server_type, tools in result
+        for tool in tools or ()
+    ]
 
-    return {"tools": all_tools, "count": len(all_tools)}
+    return ORJSONResponse({"tools": all_tools, "count": len(all_tools)})
 
 
 @router.post("/execute", response_model=MCPToolResponse)
@@ -296,9 +420,7 @@ async def execute_mcp_tool(
     db: AsyncSession = Depends(get_db),
 ):
     """Execute a tool on an MCP server."""
-    import time
-
-    result = await db.execute(select(MCPServer).where(MCPServer.id == request.server_id))
+    result = await db.execute(_SERVER_FOR_TOOL_BY_ID, {"server_id": request.server_id})
     server = result.scalar_one_or_none()
 
     if not server:
@@ -320,41 +442,47 @@ async def execute_mcp_tool(
         params=request.parameters,
     )
 
-    start_time = time.time()
-
-    try:
-        if server.type == "cml":
-            client = CMLClient(server.endpoint, server.auth_config)
-            result_data = await client.execute_tool(request.tool_name, request.parameters)
-        elif server.type == "splunk":
-            client = SplunkClient(server.endpoint, server.auth_config)
-            result_data = await client.execute_tool(request.tool_name, request.parameters)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unknown server type: {server.type}",
-            )
+    get_client = _CLIENT_GETTERS.get(server.type)
+    if get_client is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown server type: {server.type.value}",
+        )
 
-        execution_time = int((time.time() - start_time) * 1000)
+    start_time = time.monotonic()
 
-        return MCPToolResponse(
-            success=True,
-            tool_name=request.tool_name,
-            result=result_data,
-            execution_time_ms=execution_time,
+    try:
+        result_data = await asyncio.wait_for(
+            get_client(server).execute_tool(request.tool_name, request.parameters),
+            timeout=settings.mcp_tool_timeout,
         )
+        execution_time = int((time.monotonic() - start_time) * 1000)
+
+        # Upstream tool output is arbitrary JSON; encode it once with orjson
+        # instead of walking it through MCPToolResponse's `result: Any`
+        return ORJSONResponse({
+            "success": True,
+            "tool_name": request.tool_name,
+            "result": result_data,
+            "execution_time_ms": execution_time,
+            "error": None,
+        })
 
     except Exception as e:
-        execution_time = int((time.time() - start_time) * 1000)
-        logger.error("MCP tool execution failed", error=str(e))
+        execution_time = int((time.monotonic() - start_time) * 1000)
+        if isinstance(e, asyncio.TimeoutError):
+            error = f"Tool timed out after {settings.mcp_tool_timeout}s"
+        else:
+            error = str(e)
+        logger.error("MCP tool execution failed", error=error)
 
-        return MCPToolResponse(
-            success=False,
-            tool_name=request.tool_name,
-            result=None,
-            execution_time_ms=execution_time,
-            error=str(e),
-        )
+        return ORJSONResponse({
+            "success": False,
+            "tool_name": request.tool_name,
+            "result": None,
+            "execution_time_ms": execution_time,
+            "error": error,
+        })
 
 
 # =============================================================================
@@ -365,15 +493,7 @@ async def get_cml_labs(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all labs from the active CML server."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -382,9 +502,9 @@ async def get_cml_labs(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         labs = await client.get_labs()
-        return {"labs": labs}
+        return ORJSONResponse({"labs": labs})
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -398,15 +518,7 @@ async def get_cml_topology(
     db: AsyncSession = Depends(get_db),
 ):
     """Get topology graph data for a CML lab."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -415,7 +527,7 @@ async def get_cml_topology(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         topology = await client.get_topology(lab_id)
         return topology
     except Exception as e:
@@ -425,21 +537,25 @@ async def get_cml_topology(
         )
 
 
+def _to_lab_node(node: Dict[str, Any]) -> CMLLabNode:
+    """Wrap a CML node dict without re-validating it field by field."""
+    return CMLLabNode.model_construct(
+        id=node.get("id", ""),
+        label=node.get("label", ""),
+        node_definition=node.get("node_definition", ""),
+        state=node.get("state", "UNKNOWN"),
+        x=node.get("x"),
+        y=node.get("y"),
+    )
+
+
 @router.get("/cml/labs/{lab_id}/status", response_model=CMLLabStatus)
 async def get_cml_lab_status(
     lab_id: str,
     db: AsyncSession = Depends(get_db),
 ):
     """Get detailed status of a CML lab including node states."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -448,29 +564,24 @@ async def get_cml_lab_status(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
-        lab = await client.get_lab_by_id(lab_id)
-        nodes = await client.get_nodes(lab_id)
-
-        node_list = [
-            CMLLabNode(
-                id=node.get("id", ""),
-                label=node.get("label", ""),
-                node_definition=node.get("node_definition", ""),
-                state=node.get("state", "UNKNOWN"),
-                x=node.get("x"),
-                y=node.get("y"),
+        client = get_cml_client(server)
+        # Independent MCP round-trips; issue them concurrently
+        lab, nodes = await asyncio.gather(
+            client.get_lab_by_id(lab_id),
+            client.get_nodes(lab_id),
+        )
+
+        node_list = [_to_lab_node(node) for node in nodes]
+
+        return PydanticResponse(
+            CMLLabStatus(
+                lab_id=lab.get("id"),
+                title=lab.get("title", "Untitled"),
+                state=lab.get("state", "UNKNOWN"),
+                node_count=len(nodes),
+                nodes=node_list,
+                exists=True,
             )
-            for node in nodes
-        ]
-
-        return CMLLabStatus(
-            lab_id=lab.get("id"),
-            title=lab.get("title", "Untitled"),
-            state=lab.get("state", "UNKNOWN"),
-            node_count=len(nodes),
-            nodes=node_list,
-            exists=True,
         )
     except Exception as e:
         raise HTTPException(
@@ -479,23 +590,61 @@ async def get_cml_lab_status(
         )
 
 
+# __file__ is /app/routers/mcp.py, so .. takes us to /app where cml-lab is
+_DEMO_LAB_YAML_PATH = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "cml-lab", "brkops-ospf-demo.yaml")
+)
+
+
+def _read_demo_lab_yaml() -> Optional[str]:
+    """Read the demo lab topology (None if the file is missing)."""
+    if not os.path.exists(_DEMO_LAB_YAML_PATH):
+        logger.warning("Demo lab topology file not found", path=_DEMO_LAB_YAML_PATH)
+        return None
+    with open(_DEMO_LAB_YAML_PATH, "r") as f:
+        return f.read()
+
+
+# Read at import (routers are mounted during startup), so build_demo_lab never
+# does blocking file I/O on the event loop
+_DEMO_LAB_YAML = _read_demo_lab_yaml()
+
+
+# Fallback when devices.management_ip_mapping is not configured
+_DEFAULT_MGMT_IPS = {
+    "Router-1": "198.18.1.201",
+    "Router-2": "198.18.1.202",
+    "Router-3": "198.18.1.203",
+    "Router-4": "198.18.1.204",
+}
+
+
+# Demo lab id per (CML endpoint, lab title). Lets status polls fetch nodes in
+# parallel with the lab listing; the listing still confirms the id each time.
+_DEMO_LAB_ID_TTL = 300.0
+_DEMO_LAB_IDS: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
+def _cached_demo_lab_id(cache_key: Tuple[str, str]) -> Optional[str]:
+    cached = _DEMO_LAB_IDS.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _remember_demo_lab_id(cache_key: Tuple[str, str], lab_id: Optional[str]) -> None:
+    if lab_id:
+        _DEMO_LAB_IDS[cache_key] = (time.monotonic() + _DEMO_LAB_ID_TTL, lab_id)
+
+
 @router.get("/cml/labs/demo-status", response_model=CMLDemoLabStatus)
 async def get_demo_lab_status(
     db: AsyncSession = Depends(get_db),
 ):
     """Check if the BRKOPS-2585 demo lab exists and get its status."""
-    from db.models import MCPServerType
-    from services.config_service import ConfigService
-
     DEMO_LAB_TITLE = await ConfigService.get_config(db, "devices.demo_lab_title", "BRKOPS-2585-OSPF-Demo")
 
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         return CMLDemoLabStatus(
@@ -505,8 +654,23 @@ async def get_demo_lab_status(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
-        labs = await client.get_labs()
+        client = get_cml_client(server)
+        cache_key = (server.endpoint, DEMO_LAB_TITLE)
+        cached_lab_id = _cached_demo_lab_id(cache_key)
+
+        if cached_lab_id:
+            # Lab id known from an earlier poll: fetch its nodes alongside the
+            # listing instead of after it. A failed node fetch is retried below
+            # once the listing confirms the id.
+            labs, nodes = await asyncio.gather(
+                client.get_labs(),
+                client.get_nodes(cached_lab_id),
+                return_exceptions=True,
+            )
+            if isinstance(labs, BaseException):
+                raise labs
+        else:
+            labs, nodes = await client.get_labs(), None
 
         # Find demo lab by title (API returns lab_title)
         demo_lab = None
@@ -516,6 +680,7 @@ async def get_demo_lab_status(
                 break
 
         if not demo_lab:
+            _DEMO_LAB_IDS.pop(cache_key, None)
             return CMLDemoLabStatus(
                 exists=False,
                 state="NOT_FOUND",
@@ -523,36 +688,29 @@ async def get_demo_lab_status(
             )
 
         lab_id = demo_lab.get("id")
-        nodes = await client.get_nodes(lab_id)
-
-        node_list = [
-            CMLLabNode(
-                id=node.get("id", ""),
-                label=node.get("label", ""),
-                node_definition=node.get("node_definition", ""),
-                state=node.get("state", "UNKNOWN"),
-                x=node.get("x"),
-                y=node.get("y"),
+        _remember_demo_lab_id(cache_key, lab_id)
+
+        if lab_id == cached_lab_id and not isinstance(nodes, BaseException):
+            mgmt_ips = await ConfigService.get_config(db, "devices.management_ip_mapping", _DEFAULT_MGMT_IPS)
+        else:
+            # Node fetch (MCP) and management IP lookup (DB) overlap
+            nodes, mgmt_ips = await asyncio.gather(
+                client.get_nodes(lab_id),
+                ConfigService.get_config(db, "devices.management_ip_mapping", _DEFAULT_MGMT_IPS),
             )
-            for node in nodes
-        ]
-
-        # Build management IP mapping
-        mgmt_ips = await ConfigService.get_config(db, "devices.management_ip_mapping", {
-            "Router-1": "198.18.1.201",
-            "Router-2": "198.18.1.202",
-            "Router-3": "198.18.1.203",
-            "Router-4": "198.18.1.204",
-        })
 
-        return CMLDemoLabStatus(
-            exists=True,
-            lab_id=lab_id,
-            title=DEMO_LAB_TITLE,
-            state=demo_lab.get("state", "UNKNOWN"),
-            node_count=len(nodes),
-            nodes=node_list,
-            management_ips=mgmt_ips,
+        node_list = [_to_lab_node(node) for node in nodes]
+
+        return PydanticResponse(
+            CMLDemoLabStatus(
+                exists=True,
+                lab_id=lab_id,
+                title=DEMO_LAB_TITLE,
+                state=demo_lab.get("state", "UNKNOWN"),
+                node_count=len(nodes),
+                nodes=node_list,
+                management_ips=mgmt_ips,
+            )
         )
 
     except Exception as e:
@@ -570,15 +728,7 @@ async def create_cml_lab(
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new CML lab from YAML topology."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -587,7 +737,7 @@ async def create_cml_lab(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         result_data = await client.create_lab_from_yaml(request.yaml, request.title)
 
         lab_id = result_data.get("id") if isinstance(result_data, dict) else str(result_data)
@@ -611,16 +761,7 @@ async def build_demo_lab(
     db: AsyncSession = Depends(get_db),
 ):
     """Build the BRKOPS-2585 demo lab using predefined topology."""
-    import os
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -628,30 +769,22 @@ async def build_demo_lab(
             detail="No active CML server found",
         )
 
-    # Load the demo lab YAML from file
-    # __file__ is /app/routers/mcp.py, so .. takes us to /app where cml-lab is
-    yaml_path = os.path.join(os.path.dirname(__file__), "..", "cml-lab", "brkops-ospf-demo.yaml")
-    yaml_path = os.path.abspath(yaml_path)
-
-    if not os.path.exists(yaml_path):
+    yaml_content = _DEMO_LAB_YAML
+    if yaml_content is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Demo lab topology file not found",
         )
 
-    with open(yaml_path, "r") as f:
-        yaml_content = f.read()
-
     try:
-        from services.config_service import ConfigService
-
         demo_title = await ConfigService.get_config(db, "devices.demo_lab_title", "BRKOPS-2585-OSPF-Demo")
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
 
         # Check if lab already exists (API returns lab_title)
         labs = await client.get_labs()
         for lab in labs:
             if lab.get("lab_title") == demo_title:
+                _remember_demo_lab_id((server.endpoint, demo_title), lab.get("id"))
                 return LabActionResponse(
                     success=True,
                     lab_id=lab.get("id"),
@@ -661,6 +794,7 @@ async def build_demo_lab(
 
         result_data = await client.create_lab_from_yaml(yaml_content)
         lab_id = result_data.get("id") if isinstance(result_data, dict) else str(result_data)
+        _remember_demo_lab_id((server.endpoint, demo_title), lab_id)
 
         return LabActionResponse(
             success=True,
@@ -683,15 +817,7 @@ async def start_cml_lab(
     db: AsyncSession = Depends(get_db),
 ):
     """Start a CML lab."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -700,7 +826,7 @@ async def start_cml_lab(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         await client.start_lab(lab_id, wait_for_convergence)
 
         return LabActionResponse(
@@ -723,15 +849,7 @@ async def stop_cml_lab(
     db: AsyncSession = Depends(get_db),
 ):
     """Stop a CML lab."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -740,7 +858,7 @@ async def stop_cml_lab(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         await client.stop_lab(lab_id)
 
         return LabActionResponse(
@@ -763,15 +881,7 @@ async def reset_cml_lab(
     db: AsyncSession = Depends(get_db),
 ):
     """Reset all router configurations to their default demo state."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -780,16 +890,14 @@ async def reset_cml_lab(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         reset_results = await client.reset_lab_configs(lab_id)
 
-        # Check if any router failed
-        failed_routers = [
-            r for r, status in reset_results.get("reset_results", {}).items()
-            if status != "success"
-        ]
-
-        if failed_routers:
+        # Common case is every router succeeding: check that with a
+        # short-circuiting pass, and only collect names for the error message
+        router_results = reset_results.get("reset_results", {})
+        if not all(result == "success" for result in router_results.values()):
+            failed_routers = [r for r, result in router_results.items() if result != "success"]
             return LabActionResponse(
                 success=False,
                 lab_id=lab_id,
@@ -817,15 +925,7 @@ async def delete_cml_lab(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a CML lab."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.CML,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.CML)
 
     if not server:
         raise HTTPException(
@@ -834,8 +934,11 @@ async def delete_cml_lab(
         )
 
     try:
-        client = CMLClient(server.endpoint, server.auth_config)
+        client = get_cml_client(server)
         await client.delete_lab(lab_id)
+        for cache_key, (_, cached_id) in list(_DEMO_LAB_IDS.items()):
+            if cached_id == lab_id:
+                del _DEMO_LAB_IDS[cache_key]
 
         return LabActionResponse(
             success=True,
@@ -862,15 +965,7 @@ async def run_splunk_query(
     db: AsyncSession = Depends(get_db),
 ):
     """Execute a SPL query on the active Splunk server."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.SPLUNK,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.SPLUNK)
 
     if not server:
         raise HTTPException(
@@ -879,9 +974,9 @@ async def run_splunk_query(
         )
 
     try:
-        client = SplunkClient(server.endpoint, server.auth_config)
+        client = get_splunk_client(server)
         results = await client.run_query(spl, earliest, latest)
-        return results
+        return ORJSONResponse(results)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -896,15 +991,7 @@ async def generate_spl(
     db: AsyncSession = Depends(get_db),
 ):
     """Generate SPL query from natural language description."""
-    from db.models import MCPServerType
-
-    result = await db.execute(
-        select(MCPServer).where(
-            MCPServer.type == MCPServerType.SPLUNK,
-            MCPServer.is_active == True,
-        )
-    )
-    server = result.scalar_one_or_none()
+    server = await get_active_server(db, MCPServerType.SPLUNK)
 
     if not server:
         raise HTTPException(
@@ -913,7 +1000,7 @@ async def generate_spl(
         )
 
     try:
-        client = SplunkClient(server.endpoint, server.auth_config)
+        client = get_splunk_client(server)
         spl = await client.generate_spl(description, index)
         return {"spl": spl, "description": description}
     except Exception as e:
@@ -3,11 +3,17 @@
 # WebEx, ServiceNow, and other notification endpoints
 # =============================================================================
 
-from typing import List, Optional
-
+import base64
+import binascii
+import itertools
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import Row, bindparam, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.database import get_db
@@ -18,61 +24,172 @@ from models.notifications import (
     WebExMessage,
     ServiceNowTicket,
 )
+from services.job_queue import get_arq_pool
 from services.notification_service import NotificationService
+from utils.orjson_response import ORJSONResponse
+from utils.pydantic_response import PydanticResponse
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Query filters are validated by FastAPI (422 on anything else)
+ChannelFilter = Literal['webex', 'servicenow', 'email', 'slack']
+StatusFilter = Literal['pending', 'sent', 'delivered', 'failed']
+
+# Only the columns NotificationResponse exposes; rows map straight onto it
+_NOTIFICATION_COLUMNS = tuple(
+    getattr(Notification, name) for name in NotificationResponse.model_fields
+)
+
+# Delivered/failed notifications no longer change (the arq task writes the
+# outcome once), so GET /{id} keeps them per process; only job_id can still
+# move (ON DELETE SET NULL), hence the TTL. Pending rows are never cached.
+_TERMINAL_STATUSES = frozenset(('sent', 'delivered', 'failed'))
+_NOTIFICATION_CACHE_TTL = 60.0
+_NOTIFICATION_CACHE_MAX = 10_000
+_NOTIFICATION_CACHE: Dict[int, Tuple[float, NotificationResponse]] = {}
+
+_NOTIFICATION_BY_ID = select(*_NOTIFICATION_COLUMNS).where(
+    Notification.id == bindparam("notification_id")
+)
+
+
+def _build_list_query(by_cursor: bool, by_channel: bool, by_status: bool):
+    """Listing statement for one combination of optional filters."""
+    query = select(*_NOTIFICATION_COLUMNS).order_by(
+        Notification.created_at.desc(), Notification.id.desc()
+    )
+    if by_cursor:
+        query = query.where(
+            tuple_(Notification.created_at, Notification.id)
+            < tuple_(
+                bindparam("cursor_created_at", type_=Notification.created_at.type),
+                bindparam("cursor_id", type_=Notification.id.type),
+            )
+        )
+    if by_channel:
+        query = query.where(Notification.channel == bindparam("channel"))
+    if by_status:
+        query = query.where(Notification.status == bindparam("status"))
+    return query.limit(bindparam("limit"))
+
+
+# All eight filter combinations built once at import; requests only bind values
+_LIST_QUERIES = {
+    flags: _build_list_query(*flags)
+    for flags in itertools.product((False, True), repeat=3)
+}
+
+
+# Keyset pagination: the cursor is the (created_at, id) of the last row on the
+# previous page, as URL-safe base64 of a small JSON array
+def _encode_cursor(created_at: datetime, notification_id: int) -> str:
+    raw = orjson.dumps([created_at.isoformat(), notification_id])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, notification_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), int(notification_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+async def _queue_notification(
+    request: Request,
+    db: AsyncSession,
+    payload: Dict[str, Any],
+    **values: Any,
+) -> Row:
+    """
+    Insert a pending notification and hand delivery to the arq worker.
+
+    The worker's send_notification task calls the channel's service method
+    with payload and records the outcome on the row.
+    """
+    inserted = await db.execute(
+        insert(Notification)
+        .values(**values, status='pending')
+        .returning(*_NOTIFICATION_COLUMNS)
+    )
+    notification = inserted.one()
+    await db.commit()
+
+    try:
+        redis_pool = await get_arq_pool(request)
+        await redis_pool.enqueue_job(
+            "send_notification",
+            notification.id,
+            values["channel"],
+            payload,
+        )
+    except Exception as e:
+        logger.error("Failed to enqueue notification", error=str(e))
+        await db.execute(
+            update(Notification)
+            .where(Notification.id == notification.id)
+            .values(status='failed', error_message=f"Failed to enqueue notification: {str(e)}")
+        )
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue {values['channel']} notification: {str(e)}",
+        )
+
+    return notification
+
 
 @router.get("", response_model=List[NotificationResponse])
 async def list_notifications(
-    channel: Optional[str] = None,
-    status_filter: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0,
+    channel: Optional[ChannelFilter] = None,
+    status_filter: Optional[StatusFilter] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    offset: Optional[int] = Query(None, deprecated=True, description="Replaced by cursor"),
     db: AsyncSession = Depends(get_db),
 ):
-    """List notification history with optional filtering."""
-    query = select(Notification).order_by(Notification.created_at.desc())
+    """
+    List notification history with optional filtering, newest first.
+
+    Pages are keyset-based: when more rows exist the response carries an
+    X-Next-Cursor header; pass its value back as `cursor` for the next page.
+    """
+    # OFFSET paging was replaced by the cursor; fail loudly instead of
+    # silently serving the first page again
+    if offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="offset is no longer supported; pass the X-Next-Cursor value as cursor",
+        )
+
+    # One extra row tells us whether there is a next page
+    params: Dict[str, Any] = {"limit": limit + 1}
+
+    if cursor:
+        params["cursor_created_at"], params["cursor_id"] = _decode_cursor(cursor)
 
     if channel:
-        valid_channels = ['webex', 'servicenow', 'email', 'slack']
-        if channel.lower() not in valid_channels:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid channel: {channel}. Must be one of: {', '.join(valid_channels)}",
-            )
-        query = query.where(Notification.channel == channel.lower())
+        params["channel"] = channel
 
     if status_filter:
-        valid_statuses = ['pending', 'sent', 'delivered', 'failed']
-        if status_filter.lower() not in valid_statuses:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status_filter}. Must be one of: {', '.join(valid_statuses)}",
-            )
-        query = query.where(Notification.status == status_filter.lower())
-
-    query = query.offset(offset).limit(limit)
-    result = await db.execute(query)
-    notifications = result.scalars().all()
-
-    return [
-        NotificationResponse(
-            id=n.id,
-            job_id=n.job_id,
-            channel=n.channel,
-            recipient=n.recipient,
-            subject=n.subject,
-            message=n.message,
-            status=n.status,
-            response_data=n.response_data,
-            error_message=n.error_message,
-            sent_at=n.sent_at,
-            created_at=n.created_at,
-        )
-        for n in notifications
-    ]
+        params["status"] = status_filter
+
+    query = _LIST_QUERIES[bool(cursor), bool(channel), bool(status_filter)]
+    result = await db.execute(query, params)
+    rows = result.mappings().all()
+
+    headers = {}
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+    # Plain row dicts encoded once by orjson (enums, UUIDs and datetimes
+    # natively); the columns already match NotificationResponse
+    return ORJSONResponse([dict(row) for row in rows], headers=headers)
 
 
 @router.get("/{notification_id}", response_model=NotificationResponse)
@@ -81,182 +198,86 @@ async def get_notification(
     db: AsyncSession = Depends(get_db),
 ):
     """Get details of a specific notification."""
-    result = await db.execute(select(Notification).where(Notification.id == notification_id))
-    notification = result.scalar_one_or_none()
+    now = time.monotonic()
+    cached = _NOTIFICATION_CACHE.get(notification_id)
+    if cached and cached[0] > now:
+        return PydanticResponse(cached[1])
 
-    if not notification:
+    result = await db.execute(_NOTIFICATION_BY_ID, {"notification_id": notification_id})
+    row = result.one_or_none()
+
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Notification {notification_id} not found",
         )
 
-    return NotificationResponse(
-        id=notification.id,
-        job_id=notification.job_id,
-        channel=notification.channel,
-        recipient=notification.recipient,
-        subject=notification.subject,
-        message=notification.message,
-        status=notification.status,
-        response_data=notification.response_data,
-        error_message=notification.error_message,
-        sent_at=notification.sent_at,
-        created_at=notification.created_at,
-    )
+    notification = NotificationResponse.model_validate(row)
+    if notification.status in _TERMINAL_STATUSES:
+        if len(_NOTIFICATION_CACHE) >= _NOTIFICATION_CACHE_MAX:
+            _NOTIFICATION_CACHE.clear()
+        _NOTIFICATION_CACHE[notification_id] = (now + _NOTIFICATION_CACHE_TTL, notification)
+
+    return PydanticResponse(notification)
 
 
-@router.post("/webex", response_model=NotificationResponse)
+@router.post("/webex", response_model=NotificationResponse, status_code=status.HTTP_202_ACCEPTED)
 async def send_webex_message(
     message: WebExMessage,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Send a message to WebEx.
+    Queue a message to WebEx.
 
-    Supports plain text, markdown, and adaptive cards.
+    Supports plain text, markdown, and adaptive cards. Returns the pending
+    notification; poll GET /notifications/{id} for the delivery outcome.
     """
-    logger.info("Sending WebEx message")
-
-    notification_service = NotificationService(db=db)
-
-    try:
-        # Create notification record
-        notification = Notification(
-            channel='webex',
-            recipient=message.room_id or "default",
-            message=message.markdown or message.text or "",
-            status='pending',
-        )
-        db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
-
-        # Send the message
-        result = await notification_service.send_webex(
-            room_id=message.room_id,
-            text=message.text,
-            markdown=message.markdown,
-            attachments=message.attachments,
-        )
-
-        # Update notification status
-        notification.status = 'sent' if result["success"] else 'failed'
-        notification.response_data = result.get("response")
-        notification.error_message = result.get("error")
-        if result["success"]:
-            from datetime import datetime, timezone
-            notification.sent_at = datetime.now(timezone.utc)
-
-        await db.commit()
-        await db.refresh(notification)
-
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to send WebEx message: {result.get('error')}",
-            )
-
-        return NotificationResponse(
-            id=notification.id,
-            job_id=notification.job_id,
-            channel=notification.channel,
-            recipient=notification.recipient,
-            subject=notification.subject,
-            message=notification.message,
-            status=notification.status,
-            response_data=notification.response_data,
-            error_message=notification.error_message,
-            sent_at=notification.sent_at,
-            created_at=notification.created_at,
-        )
+    logger.info("Queueing WebEx message")
+
+    notification = await _queue_notification(
+        request,
+        db,
+        message.model_dump(),
+        channel='webex',
+        recipient=message.room_id or "default",
+        message=message.markdown or message.text or "",
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("WebEx send failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to send WebEx message: {str(e)}",
-        )
+    return PydanticResponse(
+        NotificationResponse.model_validate(notification),
+        status_code=status.HTTP_202_ACCEPTED,
+    )
 
 
-@router.post("/servicenow", response_model=NotificationResponse)
+@router.post("/servicenow", response_model=NotificationResponse, status_code=status.HTTP_202_ACCEPTED)
 async def create_servicenow_ticket(
     ticket: ServiceNowTicket,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Create a ServiceNow incident ticket.
-    """
-    logger.info("Creating ServiceNow ticket", short_description=ticket.short_description)
-
-    notification_service = NotificationService(db=db)
-
-    try:
-        # Create notification record
-        notification = Notification(
-            channel='servicenow',
-            recipient="ServiceNow",
-            subject=ticket.short_description,
-            message=ticket.description,
-            status='pending',
-        )
-        db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
-
-        # Create the ticket
-        result = await notification_service.create_servicenow_ticket(
-            short_description=ticket.short_description,
-            description=ticket.description,
-            category=ticket.category,
-            subcategory=ticket.subcategory,
-            priority=ticket.priority,
-            assignment_group=ticket.assignment_group,
-            caller_id=ticket.caller_id,
-            cmdb_ci=ticket.cmdb_ci,
-            custom_fields=ticket.custom_fields,
-        )
-
-        # Update notification status
-        notification.status = 'sent' if result["success"] else 'failed'
-        notification.response_data = result.get("response")
-        notification.error_message = result.get("error")
-        if result["success"]:
-            from datetime import datetime, timezone
-            notification.sent_at = datetime.now(timezone.utc)
+    Queue a ServiceNow incident ticket.
 
-        await db.commit()
-        await db.refresh(notification)
-
-        if not result["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create ServiceNow ticket: {result.get('error')}",
-            )
-
-        return NotificationResponse(
-            id=notification.id,
-            job_id=notification.job_id,
-            channel=notification.channel,
-            recipient=notification.recipient,
-            subject=notification.subject,
-            message=notification.message,
-            status=notification.status,
-            response_data=notification.response_data,
-            error_message=notification.error_message,
-            sent_at=notification.sent_at,
-            created_at=notification.created_at,
-        )
+    Returns the pending notification; poll GET /notifications/{id} for the
+    delivery outcome.
+    """
+    logger.info("Queueing ServiceNow ticket", short_description=ticket.short_description)
+
+    notification = await _queue_notification(
+        request,
+        db,
+        ticket.model_dump(),
+        channel='servicenow',
+        recipient="ServiceNow",
+        subject=ticket.short_description,
+        message=ticket.description,
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("ServiceNow ticket creation failed", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to create ServiceNow ticket: {str(e)}",
-        )
+    return PydanticResponse(
+        NotificationResponse.model_validate(notification),
+        status_code=status.HTTP_202_ACCEPTED,
+    )
 
 
 @router.post("/test/webex")
@@ -9,7 +9,7 @@ from uuid import UUID
 import structlog
 from arq import create_pool
 from arq.connections import RedisSettings
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -20,6 +20,7 @@ from models.operations import (
     OperationCreate,
     OperationResponse,
     OperationSummary,
+    OPERATION_SUMMARY_LIST_ADAPTER,
     ApprovalRequest,
     RollbackRequest,
     RollbackResponse,
@@ -259,17 +260,11 @@ async def list_operations(
     result = await db.execute(query)
     jobs = result.scalars().all()
 
-    return [
-        OperationSummary(
-            id=job.id,
-            use_case_name=job.use_case_name,
-            input_text=job.input_text,
-            current_stage=job.current_stage,
-            status=job.status,
-            created_at=job.created_at,
-        )
-        for job in jobs
-    ]
+    summaries = OPERATION_SUMMARY_LIST_ADAPTER.validate_python(jobs, from_attributes=True)
+    return Response(
+        content=OPERATION_SUMMARY_LIST_ADAPTER.dump_json(summaries),
+        media_type="application/json",
+    )
 
 
 @router.get("/{operation_id}", response_model=OperationResponse)
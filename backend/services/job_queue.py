@@ -0,0 +1,52 @@
+# =============================================================================
+# BRKOPS-2585 Job Queue Connection
+# Shared arq Redis pool for enqueuing and inspecting background jobs
+# =============================================================================
+
+from typing import Optional
+
+import structlog
+from arq import create_pool
+from arq.connections import ArqRedis, RedisSettings
+from fastapi import FastAPI, Request
+
+from config import settings
+
+logger = structlog.get_logger()
+
+redis_settings = RedisSettings(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    password=settings.redis_password or None,
+)
+
+
+async def init_arq_pool(app: FastAPI) -> None:
+    """Open the shared pool on startup; a Redis outage is retried on first use."""
+    try:
+        app.state.arq_pool = await create_pool(redis_settings)
+    except Exception as e:
+        app.state.arq_pool = None
+        logger.warning("Job queue unavailable at startup", error=str(e))
+
+
+async def close_arq_pool(app: FastAPI) -> None:
+    """Close the shared pool on shutdown."""
+    pool: Optional[ArqRedis] = getattr(app.state, "arq_pool", None)
+    if pool is not None:
+        await pool.close()
+        app.state.arq_pool = None
+
+
+async def get_arq_pool(request: Request) -> ArqRedis:
+    """
+    Return the shared arq pool, connecting lazily if startup could not.
+
+    ArqRedis is a redis.asyncio.Redis, so the pool also serves plain Redis
+    commands. Raises if Redis is unreachable.
+    """
+    pool: Optional[ArqRedis] = getattr(request.app.state, "arq_pool", None)
+    if pool is None:
+        pool = await create_pool(redis_settings)
+        request.app.state.arq_pool = pool
+    return pool
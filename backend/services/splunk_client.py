@@ -16,6 +16,30 @@ from config import settings
 
 logger = structlog.get_logger()
 
+# Process-wide pooled client for the MCP JSON-RPC calls (TLS verification off for
+# self-signed Splunk certs). Reusing it keeps connections alive across calls
+# instead of paying a TCP + TLS handshake per request.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            verify=False,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 def decode_jwt_payload(token: str) -> Optional[Dict[str, Any]]:
     """Decode JWT payload without verification (for diagnostic purposes)."""
@@ -126,38 +150,39 @@ class SplunkClient:
                 "id": 1,
             }
 
-            async with httpx.AsyncClient(verify=False, timeout=self.timeout) as client:
-                response = await client.post(
-                    self.mcp_url,
-                    json=payload,
-                    headers=headers,
-                )
+            client = _shared_http_client()
+            response = await client.post(
+                self.mcp_url,
+                json=payload,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code != 200:
-                    error_detail = response.text
-                    logger.error(
-                        "MCP tool call HTTP error",
-                        tool=tool_name,
-                        status=response.status_code,
-                        error=error_detail,
-                    )
-                    raise Exception(f"MCP tool call failed: HTTP {response.status_code}: {error_detail}")
+            if response.status_code != 200:
+                error_detail = response.text
+                logger.error(
+                    "MCP tool call HTTP error",
+                    tool=tool_name,
+                    status=response.status_code,
+                    error=error_detail,
+                )
+                raise Exception(f"MCP tool call failed: HTTP {response.status_code}: {error_detail}")
 
-                data = response.json()
+            data = response.json()
 
-                # Handle JSON-RPC error response
-                if "error" in data:
-                    error_msg = data["error"].get("message", str(data["error"]))
-                    logger.error("MCP tool call RPC error", tool=tool_name, error=error_msg)
-                    raise Exception(f"MCP tool call failed: {error_msg}")
+            # Handle JSON-RPC error response
+            if "error" in data:
+                error_msg = data["error"].get("message", str(data["error"]))
+                logger.error("MCP tool call RPC error", tool=tool_name, error=error_msg)
+                raise Exception(f"MCP tool call failed: {error_msg}")
 
-                result = data.get("result", {})
-                logger.debug(
-                    "MCP tool call successful",
-                    tool=tool_name,
-                    result_type=type(result).__name__,
-                )
-                return result
+            result = data.get("result", {})
+            logger.debug(
+                "MCP tool call successful",
+                tool=tool_name,
+                result_type=type(result).__name__,
+            )
+            return result
 
         except httpx.RequestError as e:
             logger.error(
@@ -219,72 +244,73 @@ class SplunkClient:
                 "Accept": "application/json",
             } if self.auth_header else {"Content-Type": "application/json", "Accept": "application/json"}
 
-            async with httpx.AsyncClient(verify=False, timeout=self.timeout) as client:
-                # MCP servers expose tools via POST to /mcp endpoint
-                response = await client.post(
-                    self.mcp_url,
-                    json={"jsonrpc": "2.0", "method": "tools/list", "id": 1},
-                    headers=headers,
-                )
-
-                logger.debug(
-                    "MCP list_tools response",
-                    status=response.status_code,
-                    url=self.mcp_url,
-                )
+            client = _shared_http_client()
+            # MCP servers expose tools via POST to /mcp endpoint
+            response = await client.post(
+                self.mcp_url,
+                json={"jsonrpc": "2.0", "method": "tools/list", "id": 1},
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
+            logger.debug(
+                "MCP list_tools response",
+                status=response.status_code,
+                url=self.mcp_url,
+            )
 
-                    # Check for JSON-RPC error in response
-                    if "error" in data:
-                        error_msg = data["error"].get("message", str(data["error"]))
-                        logger.error(
-                            "MCP list_tools returned error",
-                            error=error_msg,
-                            code=data["error"].get("code"),
-                        )
-                        raise Exception(f"MCP error: {error_msg}")
+            if response.status_code == 200:
+                data = response.json()
 
-                    tools = data.get("result", {}).get("tools", [])
-                    logger.info(
-                        "MCP tools retrieved successfully",
-                        tool_count=len(tools),
+                # Check for JSON-RPC error in response
+                if "error" in data:
+                    error_msg = data["error"].get("message", str(data["error"]))
+                    logger.error(
+                        "MCP list_tools returned error",
+                        error=error_msg,
+                        code=data["error"].get("code"),
                     )
-                    return [
-                        {
-                            "name": tool.get("name"),
-                            "description": tool.get("description"),
-                            "inputSchema": tool.get("inputSchema"),
-                        }
-                        for tool in tools
-                    ]
-                else:
-                    error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
-
-                    # Check for authentication issues
-                    if response.status_code in (401, 403):
-                        if self.token_info:
-                            aud = self.token_info.get("aud", "unknown")
-                            if aud != "mcp":
-                                error_msg = (
-                                    f"Authentication failed (HTTP {response.status_code}). "
-                                    f"JWT token audience is '{aud}' but must be 'mcp'. "
-                                    "Generate a new token in Splunk with audience set to 'mcp'."
-                                )
-                        else:
+                    raise Exception(f"MCP error: {error_msg}")
+
+                tools = data.get("result", {}).get("tools", [])
+                logger.info(
+                    "MCP tools retrieved successfully",
+                    tool_count=len(tools),
+                )
+                return [
+                    {
+                        "name": tool.get("name"),
+                        "description": tool.get("description"),
+                        "inputSchema": tool.get("inputSchema"),
+                    }
+                    for tool in tools
+                ]
+            else:
+                error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
+
+                # Check for authentication issues
+                if response.status_code in (401, 403):
+                    if self.token_info:
+                        aud = self.token_info.get("aud", "unknown")
+                        if aud != "mcp":
                             error_msg = (
                                 f"Authentication failed (HTTP {response.status_code}). "
-                                "Check your JWT token configuration."
+                                f"JWT token audience is '{aud}' but must be 'mcp'. "
+                                "Generate a new token in Splunk with audience set to 'mcp'."
                             )
+                    else:
+                        error_msg = (
+                            f"Authentication failed (HTTP {response.status_code}). "
+                            "Check your JWT token configuration."
+                        )
 
-                    logger.error(
-                        "MCP list_tools HTTP error",
-                        status=response.status_code,
-                        body=response.text[:500],
-                        token_audience=self.token_info.get("aud") if self.token_info else None,
-                    )
-                    raise Exception(error_msg)
+                logger.error(
+                    "MCP list_tools HTTP error",
+                    status=response.status_code,
+                    body=response.text[:500],
+                    token_audience=self.token_info.get("aud") if self.token_info else None,
+                )
+                raise Exception(error_msg)
 
         except Exception as e:
             logger.error("Failed to list MCP tools", error=str(e), url=self.mcp_url)
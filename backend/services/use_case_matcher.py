@@ -11,6 +11,19 @@ from dataclasses import dataclass
 
 from db.models import UseCase
 
+# Common stop words that don't help with protocol detection
+STOP_WORDS = frozenset({
+    'i', 'want', 'to', 'the', 'a', 'an', 'on', 'in', 'at', 'for',
+    'with', 'from', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
+    'change', 'update', 'modify', 'configure', 'set', 'add', 'remove'
+})
+
+# Exact protocol mentions that boost a use case's confidence
+PROTOCOL_KEYWORDS = frozenset({'bgp', 'ospf', 'eigrp', 'rip', 'static'})
+
+# Joins tokens into one searchable string; never occurs inside a \w+ token
+_TOKEN_SEPARATOR = "\x00"
+
 
 @dataclass
 class UseCaseMatch:
@@ -28,14 +41,7 @@ def tokenize(text: str) -> List[str]:
     # Lowercase and split on non-alphanumeric
     tokens = re.findall(r'\b\w+\b', text.lower())
 
-    # Remove common stop words that don't help with protocol detection
-    stop_words = {
-        'i', 'want', 'to', 'the', 'a', 'an', 'on', 'in', 'at', 'for',
-        'with', 'from', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
-        'change', 'update', 'modify', 'configure', 'set', 'add', 'remove'
-    }
-
-    return [t for t in tokens if t not in stop_words and len(t) > 1]
+    return [t for t in tokens if t not in STOP_WORDS and len(t) > 1]
 
 
 def match_input_to_use_case(input_text: str, use_cases: List[UseCase]) -> List[UseCaseMatch]:
@@ -49,8 +55,11 @@ def match_input_to_use_case(input_text: str, use_cases: List[UseCase]) -> List[U
     Returns:
         List of UseCaseMatch objects sorted by confidence (highest first)
     """
-    tokens = tokenize(input_text.lower())
-    token_set = set(tokens)
+    text_lower = input_text.lower()
+    tokens = tokenize(text_lower)
+    # A single-word keyword matches when it is a substring of any token; one
+    # substring search over the joined tokens replaces the per-token loop
+    token_blob = _TOKEN_SEPARATOR.join(tokens)
     matches = []
 
     for uc in use_cases:
@@ -66,12 +75,12 @@ def match_input_to_use_case(input_text: str, use_cases: List[UseCase]) -> List[U
             # Check if keyword appears in tokens or as substring
             kw_tokens = kw.split()
             if len(kw_tokens) == 1:
-                # Single word keyword - check token set
-                if kw in token_set or any(kw in token for token in tokens):
+                # Single word keyword - check tokens
+                if kw in token_blob:
                     matched.append(kw)
             else:
                 # Multi-word keyword - check if appears in original text
-                if kw in input_text.lower():
+                if kw in text_lower:
                     matched.append(kw)
 
         # Calculate confidence based on keyword overlap
@@ -81,9 +90,7 @@ def match_input_to_use_case(input_text: str, use_cases: List[UseCase]) -> List[U
             confidence = 0
 
         # Bonus for exact protocol mentions (bgp, ospf, eigrp, etc.)
-        protocol_keywords = {'bgp', 'ospf', 'eigrp', 'rip', 'static'}
-        matched_protocols = protocol_keywords.intersection(set(matched))
-        if matched_protocols:
+        if not PROTOCOL_KEYWORDS.isdisjoint(matched):
             confidence = min(confidence * 1.5, 100)  # Boost but cap at 100
 
         if confidence > 0:
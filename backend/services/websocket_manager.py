@@ -5,14 +5,19 @@
 
 import asyncio
 from typing import Dict, List, Set
-import json
 
+import orjson
 import structlog
 from fastapi import WebSocket
 
 logger = structlog.get_logger()
 
 
+def _encode(message: dict) -> str:
+    """Serialize an event once so it can be fanned out to every connection."""
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class WebSocketManager:
     """Manage WebSocket connections and event broadcasting."""
 
@@ -63,10 +68,11 @@ class WebSocketManager:
         if not self.active_connections:
             return
 
+        payload = _encode(message)
         disconnected = []
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.warning("Failed to send to WebSocket", error=str(e))
                 disconnected.append(connection)
@@ -80,10 +86,11 @@ class WebSocketManager:
         if job_id not in self.job_subscriptions:
             return
 
+        payload = _encode(message)
         disconnected = []
         for connection in self.job_subscriptions[job_id]:
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 logger.warning("Failed to send to WebSocket", error=str(e))
                 disconnected.append(connection)
@@ -15,7 +15,8 @@ ARQ_PID=$!
 
 # Start FastAPI server
 echo "Starting FastAPI server..."
-uvicorn main:app --host ${BACKEND_HOST:-0.0.0.0} --port ${BACKEND_PORT:-8000} &
+uvicorn main:app --host ${BACKEND_HOST:-0.0.0.0} --port ${BACKEND_PORT:-8000} \
+    --loop uvloop --http httptools --no-access-log &
 UVICORN_PID=$!
 
 # Handle shutdown signals
@@ -29,7 +29,7 @@ async def check_mcp_health(ctx: dict):
                 tools = []
                 healthy = False
 
-                # server.type is a string ('cml', 'splunk'), not an enum
+                # server.type is an MCPServerType member (native mcp_server_type ENUM)
                 server_type = server.type.value if hasattr(server.type, 'value') else server.type
 
                 if server_type == "cml":
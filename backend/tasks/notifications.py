@@ -0,0 +1,60 @@
+# =============================================================================
+# BRKOPS-2585 Notification Tasks
+# Deliver notifications queued by the notifications router
+# =============================================================================
+
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import structlog
+from sqlalchemy import update
+
+from db.database import async_session
+from db.models import Notification
+from services.notification_service import NotificationService
+
+logger = structlog.get_logger()
+
+
+async def send_notification(ctx: dict, notification_id: int, channel: str, payload: Dict[str, Any]):
+    """
+    Send a pending notification and record the outcome on its row.
+
+    payload holds the keyword arguments for the channel's NotificationService
+    method (send_webex / create_servicenow_ticket).
+    """
+    async with async_session() as db:
+        notification_service = NotificationService(db=db)
+
+        try:
+            if channel == "webex":
+                result = await notification_service.send_webex(**payload)
+            elif channel == "servicenow":
+                result = await notification_service.create_servicenow_ticket(**payload)
+            else:
+                result = {"success": False, "error": f"Unknown channel: {channel}"}
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+
+        sent = result["success"]
+        await db.execute(
+            update(Notification)
+            .where(Notification.id == notification_id)
+            .values(
+                status='sent' if sent else 'failed',
+                response_data=result.get("response"),
+                error_message=result.get("error"),
+                sent_at=datetime.now(timezone.utc) if sent else None,
+            )
+        )
+        await db.commit()
+
+    if sent:
+        logger.info("Notification sent", notification_id=notification_id, channel=channel)
+    else:
+        logger.error(
+            "Notification send failed",
+            notification_id=notification_id,
+            channel=channel,
+            error=result.get("error"),
+        )
@@ -0,0 +1,20 @@
+# =============================================================================
+# BRKOPS-2585 orjson Response Class
+# Default JSON response class for the API
+# =============================================================================
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (native datetime/UUID, non-str keys)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -0,0 +1,22 @@
+# =============================================================================
+# BRKOPS-2585 Pydantic Response Class
+# Single-pass serialization for response models
+# =============================================================================
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class PydanticResponse(Response):
+    """
+    JSON response rendered straight from a Pydantic model by pydantic-core.
+
+    Returning this from a route skips FastAPI's response_model round-trip
+    (validate, dump to Python objects, encode again). Keep response_model on
+    the decorator so the OpenAPI schema is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
@@ -20,6 +20,7 @@ from tasks.pipeline import (
     process_notifications,
 )
 from tasks.health import check_mcp_health
+from tasks.notifications import send_notification
 
 
 async def startup(ctx: dict) -> None:
@@ -88,6 +89,7 @@ class WorkerSettings:
         process_splunk_analysis,
         process_ai_validation,
         process_notifications,
+        send_notification,
     ]
 
     # Cron jobs (scheduled tasks)
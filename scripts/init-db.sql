@@ -30,14 +30,17 @@ CREATE INDEX idx_config_variables_key ON config_variables(key);
 -- MCP Server Registry
 -- Tracks external MCP servers (CML, Splunk)
 -- =============================================================================
+CREATE TYPE mcp_server_type AS ENUM ('cml', 'splunk', 'custom');
+CREATE TYPE health_status AS ENUM ('healthy', 'unhealthy', 'unknown');
+
 CREATE TABLE IF NOT EXISTS mcp_servers (
     id SERIAL PRIMARY KEY,
     name VARCHAR(100) NOT NULL,
-    type VARCHAR(50) NOT NULL CHECK (type IN ('cml', 'splunk', 'custom')),
+    type mcp_server_type NOT NULL,
     endpoint VARCHAR(500) NOT NULL,
     auth_config JSONB DEFAULT '{}',
     is_active BOOLEAN DEFAULT TRUE,
-    health_status VARCHAR(50) DEFAULT 'unknown' CHECK (health_status IN ('healthy', 'unhealthy', 'unknown')),
+    health_status health_status DEFAULT 'unknown',
     last_health_check TIMESTAMPTZ,
     available_tools JSONB DEFAULT '[]',
     created_at TIMESTAMPTZ DEFAULT NOW(),
@@ -47,6 +50,7 @@ CREATE TABLE IF NOT EXISTS mcp_servers (
 CREATE UNIQUE INDEX IF NOT EXISTS idx_mcp_servers_name_type ON mcp_servers(name, type);
 CREATE INDEX IF NOT EXISTS idx_mcp_servers_type ON mcp_servers(type);
 CREATE INDEX IF NOT EXISTS idx_mcp_servers_active ON mcp_servers(is_active);
+CREATE INDEX IF NOT EXISTS idx_mcp_servers_type_active ON mcp_servers(type) WHERE is_active;
 
 -- =============================================================================
 -- Pipeline Jobs
@@ -112,10 +116,24 @@ CREATE TABLE IF NOT EXISTS pipeline_jobs (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Keep hot columns (status, stage, timestamps) dense in the heap; wide cold
+-- values are moved to TOAST early (see migration 018)
+ALTER TABLE pipeline_jobs SET (toast_tuple_target = 256);
+ALTER TABLE pipeline_jobs
+    ALTER COLUMN input_text SET STORAGE EXTERNAL,
+    ALTER COLUMN input_audio_url SET STORAGE EXTERNAL,
+    ALTER COLUMN error_message SET STORAGE EXTERNAL;
+
 CREATE INDEX idx_pipeline_jobs_status ON pipeline_jobs(status);
 CREATE INDEX idx_pipeline_jobs_stage ON pipeline_jobs(current_stage);
 CREATE INDEX idx_pipeline_jobs_created ON pipeline_jobs(created_at DESC);
 CREATE INDEX idx_pipeline_jobs_use_case ON pipeline_jobs(use_case_name);
+CREATE INDEX idx_pipeline_jobs_status_created ON pipeline_jobs(status, created_at);
+CREATE INDEX idx_pipeline_jobs_active ON pipeline_jobs(current_stage)
+    WHERE status IN ('running', 'paused', 'queued');
+CREATE INDEX idx_pipeline_jobs_stages_gin ON pipeline_jobs USING GIN (stages_data jsonb_path_ops);
+CREATE INDEX idx_pipeline_jobs_finished_completed ON pipeline_jobs(completed_at)
+    WHERE status IN ('completed', 'cancelled');
 
 -- =============================================================================
 -- Use Case Templates
@@ -171,6 +189,8 @@ CREATE INDEX idx_notifications_job ON notifications(job_id);
 CREATE INDEX idx_notifications_channel ON notifications(channel);
 CREATE INDEX idx_notifications_status ON notifications(status);
 CREATE INDEX idx_notifications_created ON notifications(created_at DESC);
+CREATE INDEX idx_notifications_channel_created ON notifications(channel, created_at);
+CREATE INDEX idx_notifications_status_created ON notifications(status, created_at);
 
 -- =============================================================================
 -- Audit Log
@@ -196,13 +216,15 @@ CREATE INDEX idx_audit_logs_created ON audit_logs(created_at DESC);
 -- =============================================================================
 -- Users Table (for Admin panel)
 -- =============================================================================
+CREATE TYPE user_role AS ENUM ('admin', 'operator', 'viewer');
+
 CREATE TABLE IF NOT EXISTS users (
     id SERIAL PRIMARY KEY,
     username VARCHAR(100) UNIQUE NOT NULL,
     email VARCHAR(255) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
     full_name VARCHAR(200),
-    role VARCHAR(50) DEFAULT 'viewer' CHECK (role IN ('admin', 'operator', 'viewer')),
+    role user_role DEFAULT 'viewer',
     is_active BOOLEAN DEFAULT TRUE,
     last_login TIMESTAMPTZ,
     created_at TIMESTAMPTZ DEFAULT NOW(),
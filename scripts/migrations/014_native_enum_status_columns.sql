@@ -0,0 +1,31 @@
+-- =============================================================================
+-- Migration 014: Native ENUM types for health_status and role
+-- =============================================================================
+-- mcp_servers.health_status and users.role were VARCHAR(50) columns guarded by
+-- CHECK constraints. Convert them to native PostgreSQL ENUMs (4 bytes per row,
+-- integer comparison) matching notification_channel / notification_status.
+-- =============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'health_status') THEN
+        CREATE TYPE health_status AS ENUM ('healthy', 'unhealthy', 'unknown');
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'user_role') THEN
+        CREATE TYPE user_role AS ENUM ('admin', 'operator', 'viewer');
+    END IF;
+END $$;
+
+-- mcp_servers.health_status
+ALTER TABLE mcp_servers DROP CONSTRAINT IF EXISTS mcp_servers_health_status_check;
+ALTER TABLE mcp_servers ALTER COLUMN health_status DROP DEFAULT;
+ALTER TABLE mcp_servers
+    ALTER COLUMN health_status TYPE health_status USING health_status::health_status;
+ALTER TABLE mcp_servers ALTER COLUMN health_status SET DEFAULT 'unknown';
+
+-- users.role
+ALTER TABLE users DROP CONSTRAINT IF EXISTS users_role_check;
+ALTER TABLE users ALTER COLUMN role DROP DEFAULT;
+ALTER TABLE users
+    ALTER COLUMN role TYPE user_role USING role::user_role;
+ALTER TABLE users ALTER COLUMN role SET DEFAULT 'viewer';
@@ -0,0 +1,20 @@
+-- =============================================================================
+-- Migration 015: Composite and partial indexes for pipeline query patterns
+-- =============================================================================
+-- - "jobs by status, newest first" (dashboards, job stats)
+-- - "active jobs by stage" (running / paused / queued only, kept small)
+-- - "active MCP server of type X" (every CML/Splunk lookup)
+-- notifications(job_id) and audit_logs(entity_type, entity_id) are already
+-- covered by idx_notifications_job and idx_audit_logs_entity.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_status_created
+    ON pipeline_jobs(status, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_active
+    ON pipeline_jobs(current_stage)
+    WHERE status IN ('running', 'paused', 'queued');
+
+CREATE INDEX IF NOT EXISTS idx_mcp_servers_type_active
+    ON mcp_servers(type)
+    WHERE is_active;
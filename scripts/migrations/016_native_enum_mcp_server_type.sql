@@ -0,0 +1,18 @@
+-- =============================================================================
+-- Migration 016: Native ENUM type for mcp_servers.type
+-- =============================================================================
+-- mcp_servers.type has three possible values but was stored as VARCHAR(50)
+-- with a CHECK constraint. A native ENUM stores 4 bytes per row and compares
+-- as an integer in the (type, is_active) lookups issued on every CML/Splunk call.
+-- =============================================================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'mcp_server_type') THEN
+        CREATE TYPE mcp_server_type AS ENUM ('cml', 'splunk', 'custom');
+    END IF;
+END $$;
+
+ALTER TABLE mcp_servers DROP CONSTRAINT IF EXISTS mcp_servers_type_check;
+ALTER TABLE mcp_servers
+    ALTER COLUMN type TYPE mcp_server_type USING type::mcp_server_type;
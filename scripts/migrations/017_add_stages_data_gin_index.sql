@@ -0,0 +1,10 @@
+-- =============================================================================
+-- Migration 017: GIN index on pipeline_jobs.stages_data
+-- =============================================================================
+-- jsonb_path_ops only supports containment (@>) but is smaller and faster than
+-- the default jsonb_ops, which matches the "job whose stage X has status Y"
+-- lookups, e.g. stages_data @> '{"cml_deployment": {"status": "completed"}}'.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_stages_gin
+    ON pipeline_jobs USING GIN (stages_data jsonb_path_ops);
@@ -0,0 +1,18 @@
+-- =============================================================================
+-- Migration 018: Push cold pipeline_jobs columns out of the heap row
+-- =============================================================================
+-- Scans for "running jobs" only need status / current_stage / timestamps, but
+-- the heap tuple also carries input_text, error details, result and the
+-- per-stage JSON. Lowering toast_tuple_target makes PostgreSQL move those wide
+-- values to the TOAST table much earlier, so many more hot rows fit per 8KB
+-- page. STORAGE EXTERNAL keeps the cold text columns out-of-line without
+-- compression, so fetching them for a single job detail is one cheap read.
+-- The setting only applies to rows written after this migration.
+-- =============================================================================
+
+ALTER TABLE pipeline_jobs SET (toast_tuple_target = 256);
+
+ALTER TABLE pipeline_jobs
+    ALTER COLUMN input_text SET STORAGE EXTERNAL,
+    ALTER COLUMN input_audio_url SET STORAGE EXTERNAL,
+    ALTER COLUMN error_message SET STORAGE EXTERNAL;
@@ -0,0 +1,36 @@
+-- =============================================================================
+-- Migration 019: Make the updated_at triggers authoritative
+-- =============================================================================
+-- The ORM models no longer send "updated_at = now()" with every UPDATE; the
+-- shared update_updated_at_column() BEFORE UPDATE trigger maintains the column
+-- instead. init-db.sql already installs it, this migration (re)creates the
+-- function and triggers for databases that predate or lost them.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_config_variables_updated_at ON config_variables;
+CREATE TRIGGER update_config_variables_updated_at BEFORE UPDATE ON config_variables
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_mcp_servers_updated_at ON mcp_servers;
+CREATE TRIGGER update_mcp_servers_updated_at BEFORE UPDATE ON mcp_servers
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_pipeline_jobs_updated_at ON pipeline_jobs;
+CREATE TRIGGER update_pipeline_jobs_updated_at BEFORE UPDATE ON pipeline_jobs
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_use_cases_updated_at ON use_cases;
+CREATE TRIGGER update_use_cases_updated_at BEFORE UPDATE ON use_cases
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_users_updated_at ON users;
+CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
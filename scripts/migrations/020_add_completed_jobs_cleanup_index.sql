@@ -0,0 +1,14 @@
+-- =============================================================================
+-- Migration 020: Partial index for completed-job cleanup
+-- =============================================================================
+-- DELETE /jobs/completed removes completed/cancelled jobs older than a cutoff
+-- (status IN ('completed', 'cancelled') AND completed_at < :cutoff). Indexing
+-- completed_at only for finished jobs keeps the index small and turns the
+-- cleanup into an index range scan. "Recent jobs" (created_at DESC) and the
+-- per-status counts are already served by idx_pipeline_jobs_created and
+-- idx_pipeline_jobs_status / idx_pipeline_jobs_status_created.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_finished_completed
+    ON pipeline_jobs(completed_at)
+    WHERE status IN ('completed', 'cancelled');
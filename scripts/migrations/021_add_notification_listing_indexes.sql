@@ -0,0 +1,16 @@
+-- =============================================================================
+-- Migration 021: Composite indexes for notification history listing
+-- =============================================================================
+-- GET /notifications filters by channel or status and returns the newest rows
+-- first (ORDER BY created_at DESC LIMIT n). With only the single-column
+-- indexes Postgres has to collect every matching row and sort it; with
+-- (channel, created_at) / (status, created_at) it walks one index backwards
+-- and stops after n rows. The unfiltered listing is already served by
+-- idx_notifications_created.
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_notifications_channel_created
+    ON notifications(channel, created_at);
+
+CREATE INDEX IF NOT EXISTS idx_notifications_status_created
+    ON notifications(status, created_at);